@@ -1,10 +1,30 @@
 """
 Financial analytics calculator for simulation results
 """
+import functools
+import math
+import sys
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, TextIO
 import numpy_financial as npf
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+try:
+    from pyxirr import irr as _pyxirr_irr
+except ImportError:  # pyxirr is an optional accelerator
+    _pyxirr_irr = None
+
+# Report section separators
+SEP_EQ = '=' * 70
+SEP_DASH = '─' * 70
+
+# Only long cash-flow series are worth memoizing; short ones solve faster than they hash
+_IRR_CACHE_MIN_PERIODS = 50
+
 def calculate_npv(cash_flows: List[float], discount_rate: float = 0.05) -> float:
     """
     Calculate Net Present Value
@@ -16,10 +36,37 @@ def calculate_npv(cash_flows: List[float], discount_rate: float = 0.05) -> float
     Returns:
         NPV value
     """
-    npv = 0
-    for t, cf in enumerate(cash_flows):
-        npv += cf / ((1 + discount_rate) ** t)
-    return npv
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    if _npv_jit is not None:
+        return float(_npv_jit(cf, discount_rate))
+    return float(cf @ _discount_factors(discount_rate, cf.size))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _npv_jit(cf, discount_rate):
+        """Compiled NPV: discount factor by multiplicative recurrence, one mul per period"""
+        npv = 0.0
+        discount = 1.0
+        step = 1.0 / (1.0 + discount_rate)
+        for t in range(cf.shape[0]):
+            npv += cf[t] * discount
+            discount *= step
+        return npv
+else:
+    _npv_jit = None
+
+
+@functools.lru_cache(maxsize=32)
+def _discount_factors(discount_rate: float, num_periods: int) -> np.ndarray:
+    """
+    Discount factor (1 + r)^-t for each period t
+    
+    Cached per (rate, horizon); the returned array is shared, so it is read-only.
+    """
+    factors = np.power(1.0 + discount_rate, -np.arange(num_periods, dtype=np.float64))
+    factors.flags.writeable = False
+    return factors
 
 
 def calculate_irr(cash_flows: List[float]) -> float:
@@ -33,11 +80,81 @@ def calculate_irr(cash_flows: List[float]) -> float:
         IRR as a decimal (e.g., 0.15 = 15%)
     """
     try:
-        return npf.irr(cash_flows)
+        cf = np.asarray(cash_flows, dtype=np.float64)
+        if cf.size >= _IRR_CACHE_MIN_PERIODS:
+            return _irr_cached(cf.tobytes())
+        return _solve_irr(cf)
     except:
         return 0.0
 
 
+def calculate_irr_batch(cf_matrix: np.ndarray) -> np.ndarray:
+    """
+    Calculate IRR for many cash-flow scenarios at once
+    
+    Args:
+        cf_matrix: 2-D array, one scenario per row (pad shorter series with zeros)
+    
+    Returns:
+        Array of IRRs as decimals, NaN where no rate was found
+    """
+    cf_matrix = np.atleast_2d(np.asarray(cf_matrix, dtype=np.float64))
+    # pyxirr's irr does not broadcast over rows, so each scenario is solved separately
+    return np.array([calculate_irr(cf) for cf in cf_matrix], dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=256)
+def _irr_cached(cf_bytes: bytes) -> float:
+    """IRR memoized on the raw float64 bytes of the cash flows"""
+    return _solve_irr(np.frombuffer(cf_bytes, dtype=np.float64))
+
+
+def _solve_irr(cf: np.ndarray) -> float:
+    """
+    IRR from the fastest available solver
+    
+    Tries pyxirr (if installed), then Newton-Raphson, then numpy_financial.
+    """
+    if _pyxirr_irr is not None:
+        irr = _pyxirr_irr(cf, silent=True)
+        if irr is not None:
+            return irr
+    irr = _irr_newton(cf)
+    if np.isnan(irr):
+        # Newton did not converge from the default guess
+        return npf.irr(cf)
+    return irr
+
+
+def _irr_newton(cf: np.ndarray, guess: float = 0.1,
+                tol: float = 1e-6, maxiter: int = 50) -> float:
+    """
+    Solve NPV(r) = 0 with Newton-Raphson
+    
+    Uses the analytic derivative dNPV/dr = -sum(t * C_t / (1 + r)^(t + 1)).
+    Returns NaN if the iteration fails to converge.
+    """
+    t = np.arange(cf.size, dtype=np.float64)
+    r = guess
+    # Diverging iterates overflow the discount factors; treat that as non-convergence
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        for _ in range(maxiter):
+            if r <= -1.0:
+                break
+            discount = np.power(1.0 + r, -t)
+            npv = cf @ discount
+            dnpv = -(t * cf) @ discount / (1.0 + r)
+            if dnpv == 0:
+                break
+            step = npv / dnpv
+            if not np.isfinite(step):
+                break
+            r -= step
+            if abs(step) < tol:
+                return float(r)
+    return float('nan')
+
+
 def calculate_roi(initial_investment: float, total_return: float) -> float:
     """
     Calculate Return on Investment
@@ -54,6 +171,48 @@ def calculate_roi(initial_investment: float, total_return: float) -> float:
     return ((total_return - initial_investment) / initial_investment) * 100
 
 
+def _quantiles(values: np.ndarray, qs) -> np.ndarray:
+    """
+    Quantiles via a single np.partition pass
+    
+    Matches np.percentile's default linear interpolation without sorting
+    more of the array than the requested order statistics need.
+    """
+    positions = np.asarray(qs, dtype=np.float64) * (values.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    partitioned = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (positions - lower)
+
+
+# Recommendation tiers, best first
+_RECOMMENDATIONS = (
+    ("STRONG BUY", "Excellent value with high returns and reliable payback"),
+    ("BUY", "Positive returns with acceptable risk"),
+    ("HOLD", "Marginal returns, consider alternatives"),
+    ("PASS", "Poor returns or high risk"),
+)
+
+
+def get_recommendation(npv: float, roi: float, break_even_rate: float,
+                       purchase_price: float) -> tuple:
+    """
+    Pick a recommendation tier from NPV, ROI and break-even probability
+    
+    Returns:
+        (recommendation, reasoning) tuple
+    """
+    if npv > purchase_price * 0.5 and roi > 100 and break_even_rate > 0.7:
+        tier = 0
+    elif npv > 0 and roi > 50 and break_even_rate > 0.5:
+        tier = 1
+    elif npv > -purchase_price * 0.2 and break_even_rate > 0.3:
+        tier = 2
+    else:
+        tier = 3
+    return _RECOMMENDATIONS[tier]
+
+
 def analyze_property_investment(simulation_stats: Dict, 
                                 discount_rate: float = 0.05) -> Dict:
     """
@@ -68,31 +227,28 @@ def analyze_property_investment(simulation_stats: Dict,
     """
     # Extract data
     purchase_price = simulation_stats['property_price']
-    mean_rent_by_turn = simulation_stats['rent_by_turn_mean']
+    # Dollar-level rent paths are stored in float32; NPV/IRR accumulate in float64
+    mean_rent_by_turn = np.asarray(simulation_stats['rent_by_turn_mean'], dtype=np.float32)
     total_rent_mean = simulation_stats['total_rent_mean']
     break_even_mean = simulation_stats['break_even_mean']
     break_even_distribution = simulation_stats['break_even_distribution']
+    break_even_rate = simulation_stats['break_even_rate']
+    win_rate = simulation_stats['win_rate']
+    bankruptcy_rate = simulation_stats['bankruptcy_rate']
     
-    # Calculate NPV for mean cash flow
-    cash_flows = [-purchase_price] + list(mean_rent_by_turn[1:])
-    npv_mean = calculate_npv(cash_flows, discount_rate)
-    
-    # Calculate NPV distribution (sample from simulations)
-    # For simplicity, we'll calculate NPV for different scenarios
+    # Discount factors are shared by every NPV below (same horizon and rate)
     num_turns = len(mean_rent_by_turn)
-    npv_samples = []
-    
-    # Generate sample NPVs using the percentile data
-    p25_rent = simulation_stats['rent_by_turn_p25']
-    p75_rent = simulation_stats['rent_by_turn_p75']
+    discount = _discount_factors(discount_rate, num_turns)
     
-    # NPV at 25th percentile (pessimistic)
-    cash_flows_p25 = [-purchase_price] + list(p25_rent[1:])
-    npv_p25 = calculate_npv(cash_flows_p25, discount_rate)
+    # Cash flows: purchase at turn 0, then the mean / 25th / 75th percentile rent paths
+    p25_rent = np.asarray(simulation_stats['rent_by_turn_p25'], dtype=np.float32)
+    p75_rent = np.asarray(simulation_stats['rent_by_turn_p75'], dtype=np.float32)
+    scenario_cash_flows = np.stack([mean_rent_by_turn, p25_rent, p75_rent]).astype(np.float64)
+    scenario_cash_flows[:, 0] = -purchase_price
+    cash_flows = scenario_cash_flows[0]
     
-    # NPV at 75th percentile (optimistic)  
-    cash_flows_p75 = [-purchase_price] + list(p75_rent[1:])
-    npv_p75 = calculate_npv(cash_flows_p75, discount_rate)
+    # NPV for all three scenarios in one matrix-vector product
+    npv_mean, npv_p25, npv_p75 = (float(npv) for npv in scenario_cash_flows @ discount)
     
     # Calculate IRR
     irr_value = calculate_irr(cash_flows)
@@ -101,9 +257,13 @@ def analyze_property_investment(simulation_stats: Dict,
     roi_value = calculate_roi(purchase_price, total_rent_mean)
     
     # Payback period statistics
-    payback_p50 = break_even_mean if break_even_mean > 0 else None
-    payback_p25 = np.percentile(break_even_distribution, 25) if break_even_distribution else None
-    payback_p75 = np.percentile(break_even_distribution, 75) if break_even_distribution else None
+    # NaN marks "never broke even" so payback values stay plain floats
+    payback_p50 = break_even_mean if break_even_mean > 0 else float('nan')
+    break_even_array = np.asarray(break_even_distribution, dtype=np.float64)
+    if break_even_array.size:
+        payback_p25, payback_p75 = _quantiles(break_even_array, (0.25, 0.75))
+    else:
+        payback_p25 = payback_p75 = float('nan')
     
     # Expected value calculation
     expected_profit = total_rent_mean - purchase_price
@@ -114,20 +274,10 @@ def analyze_property_investment(simulation_stats: Dict,
     coefficient_of_variation = (rent_volatility / total_rent_mean * 100) if total_rent_mean > 0 else 0
     
     # Recommendation logic
-    def get_recommendation(npv, roi, break_even_rate, payback):
-        if npv > purchase_price * 0.5 and roi > 100 and break_even_rate > 0.7:
-            return "STRONG BUY", "Excellent value with high returns and reliable payback"
-        elif npv > 0 and roi > 50 and break_even_rate > 0.5:
-            return "BUY", "Positive returns with acceptable risk"
-        elif npv > -purchase_price * 0.2 and break_even_rate > 0.3:
-            return "HOLD", "Marginal returns, consider alternatives"
-        else:
-            return "PASS", "Poor returns or high risk"
-    
     recommendation, reasoning = get_recommendation(
         npv_mean, roi_value, 
-        simulation_stats['break_even_rate'], 
-        payback_p50
+        break_even_rate, 
+        purchase_price
     )
     
     return {
@@ -151,13 +301,13 @@ def analyze_property_investment(simulation_stats: Dict,
         'payback_mean_turns': payback_p50,
         'payback_p25_turns': payback_p25,
         'payback_p75_turns': payback_p75,
-        'break_even_probability': simulation_stats['break_even_rate'],
+        'break_even_probability': break_even_rate,
         
         # Risk Metrics
         'rent_volatility': rent_volatility,
         'coefficient_of_variation': coefficient_of_variation,
-        'win_rate_with_property': simulation_stats['win_rate'],
-        'bankruptcy_risk': simulation_stats['bankruptcy_rate'],
+        'win_rate_with_property': win_rate,
+        'bankruptcy_risk': bankruptcy_rate,
         
         # Recommendation
         'recommendation': recommendation,
@@ -167,66 +317,82 @@ def analyze_property_investment(simulation_stats: Dict,
         'cash_flow_mean': mean_rent_by_turn,
         'cash_flow_p25': p25_rent,
         'cash_flow_p75': p75_rent,
-        'break_even_distribution': break_even_distribution,
+        'break_even_distribution': break_even_array,
     }
 
 
-def format_analysis_report(property_name: str, analysis: Dict) -> str:
-    """Generate a formatted text report"""
+def format_analysis_report(property_name: str, analysis: Dict,
+                           out: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Generate a formatted text report
+    
+    Args:
+        property_name: Property the analysis is for
+        analysis: Output from analyze_property_investment
+        out: If given, write the report lines straight to this stream
     
-    # Handle None values
+    Returns:
+        The report string, or None when written to out
+    """
+    
+    # NaN payback means the property never broke even
     payback_mean = analysis['payback_mean_turns']
     payback_p25 = analysis['payback_p25_turns']
     payback_p75 = analysis['payback_p75_turns']
     
-    payback_mean_str = f"{payback_mean:.1f} turns" if payback_mean else "N/A (never broke even)"
-    if payback_p25 and payback_p75:
-        payback_range_str = f"{payback_p25:.1f} - {payback_p75:.1f} turns"
-    else:
+    payback_mean_str = "N/A (never broke even)" if math.isnan(payback_mean) else f"{payback_mean:.1f} turns"
+    if math.isnan(payback_p25) or math.isnan(payback_p75):
         payback_range_str = "N/A"
+    else:
+        payback_range_str = f"{payback_p25:.1f} - {payback_p75:.1f} turns"
     
-    report = f"""
-{'='*70}
-INVESTMENT ANALYSIS: {property_name}
-{'='*70}
-
-PURCHASE DECISION: {analysis['recommendation']}
-Reasoning: {analysis['reasoning']}
-
-FINANCIAL METRICS
-{'─'*70}
-Purchase Price:           ${analysis['purchase_price']:,.0f}
-Expected Total Rent:      ${analysis['expected_total_rent']:,.0f}
-Expected Profit:          ${analysis['expected_profit']:,.0f}
-Profit Margin:            {analysis['profit_margin_pct']:.1f}%
-
-NET PRESENT VALUE
-{'─'*70}
-NPV (Mean):               ${analysis['npv_mean']:,.0f}
-NPV (25th percentile):    ${analysis['npv_p25']:,.0f}
-NPV (75th percentile):    ${analysis['npv_p75']:,.0f}
-
-RETURNS
-{'─'*70}
-Internal Rate of Return:  {analysis['irr']:.2f}%
-Return on Investment:     {analysis['roi']:.1f}%
-
-PAYBACK PERIOD
-{'─'*70}
-Mean Payback:             {payback_mean_str}
-25th-75th Percentile:     {payback_range_str}
-Break-Even Probability:   {analysis['break_even_probability']*100:.1f}%
-
-RISK ASSESSMENT
-{'─'*70}
-Rent Volatility:          ${analysis['rent_volatility']:,.0f}
-Coefficient of Variation: {analysis['coefficient_of_variation']:.1f}%
-Win Rate with Property:   {analysis['win_rate_with_property']*100:.1f}%
-Bankruptcy Risk:          {analysis['bankruptcy_risk']*100:.1f}%
-
-{'='*70}
-"""
-    return report
+    lines = [
+        "",
+        SEP_EQ,
+        f"INVESTMENT ANALYSIS: {property_name}",
+        SEP_EQ,
+        "",
+        f"PURCHASE DECISION: {analysis['recommendation']}",
+        f"Reasoning: {analysis['reasoning']}",
+        "",
+        "FINANCIAL METRICS",
+        SEP_DASH,
+        f"Purchase Price:           ${analysis['purchase_price']:,.0f}",
+        f"Expected Total Rent:      ${analysis['expected_total_rent']:,.0f}",
+        f"Expected Profit:          ${analysis['expected_profit']:,.0f}",
+        f"Profit Margin:            {analysis['profit_margin_pct']:.1f}%",
+        "",
+        "NET PRESENT VALUE",
+        SEP_DASH,
+        f"NPV (Mean):               ${analysis['npv_mean']:,.0f}",
+        f"NPV (25th percentile):    ${analysis['npv_p25']:,.0f}",
+        f"NPV (75th percentile):    ${analysis['npv_p75']:,.0f}",
+        "",
+        "RETURNS",
+        SEP_DASH,
+        f"Internal Rate of Return:  {analysis['irr']:.2f}%",
+        f"Return on Investment:     {analysis['roi']:.1f}%",
+        "",
+        "PAYBACK PERIOD",
+        SEP_DASH,
+        f"Mean Payback:             {payback_mean_str}",
+        f"25th-75th Percentile:     {payback_range_str}",
+        f"Break-Even Probability:   {analysis['break_even_probability']*100:.1f}%",
+        "",
+        "RISK ASSESSMENT",
+        SEP_DASH,
+        f"Rent Volatility:          ${analysis['rent_volatility']:,.0f}",
+        f"Coefficient of Variation: {analysis['coefficient_of_variation']:.1f}%",
+        f"Win Rate with Property:   {analysis['win_rate_with_property']*100:.1f}%",
+        f"Bankruptcy Risk:          {analysis['bankruptcy_risk']*100:.1f}%",
+        "",
+        SEP_EQ,
+        "",
+    ]
+    if out is not None:
+        out.writelines(line + "\n" for line in lines)
+        return None
+    return "\n".join(lines)
 
 
 # Test the analytics
@@ -240,7 +406,7 @@ if __name__ == '__main__':
         'break_even_mean': 12.5,
         'break_even_median': 11.0,
         'break_even_std': 4.2,
-        'break_even_distribution': np.random.normal(12.5, 4.2, 800).tolist(),
+        'break_even_distribution': np.random.normal(12.5, 4.2, 800),
         'break_even_rate': 0.80,
         'total_rent_mean': 875,
         'total_rent_median': 820,
@@ -258,7 +424,7 @@ if __name__ == '__main__':
     
     analysis = analyze_property_investment(mock_stats, discount_rate=0.05)
     
-    print(format_analysis_report('North Carolina Avenue', analysis))
+    format_analysis_report('North Carolina Avenue', analysis, out=sys.stdout)
     
     print("\nKey Metrics Summary:")
     print(f"  NPV: ${analysis['npv_mean']:,.0f}")
@@ -4,6 +4,8 @@ Compare simulation results WITH and WITHOUT house building
 This shows the dramatic impact of property development
 """
 
+import math
+
 from main import run_property_analysis
 
 print("\n" + "="*70)
@@ -101,12 +103,14 @@ rent_improvement = ((rent_yes - rent_no) / rent_no * 100) if rent_no > 0 else 0
 print(f"{'Expected Total Rent':<30} ${rent_no:>17,.0f}  ${rent_yes:>17,.0f}  {rent_improvement:>13.1f}%")
 
 # Payback
-payback_no = analysis_no_houses.get('payback_mean_turns')
-payback_yes = analysis_with_houses.get('payback_mean_turns')
-if payback_no and payback_yes:
+payback_no = analysis_no_houses['payback_mean_turns']
+payback_yes = analysis_with_houses['payback_mean_turns']
+breaks_even_no = not math.isnan(payback_no)
+breaks_even_yes = not math.isnan(payback_yes)
+if breaks_even_no and breaks_even_yes:
     payback_improvement = payback_no - payback_yes
     print(f"{'Payback Period (turns)':<30} {payback_no:>17.1f}  {payback_yes:>17.1f}  {payback_improvement:>13.1f}")
-elif payback_yes and not payback_no:
+elif breaks_even_yes and not breaks_even_no:
     print(f"{'Payback Period (turns)':<30} {'Never':>17}  {payback_yes:>17.1f}  {'Now viable!':>13}")
 else:
     print(f"{'Payback Period (turns)':<30} {'N/A':>17}  {'N/A':>17}  {'N/A':>13}")
@@ -3,7 +3,16 @@
 Compare multiple properties to find the best investment
 """
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from analytics import calculate_irr_batch
 from main import run_property_analysis
+from mechanics_numba import precompile
+from properties import load_board
 
 # Properties to compare
 properties_to_test = [
@@ -16,79 +25,118 @@ properties_to_test = [
     "B&O Railroad"
 ]
 
-print("\n" + "="*70)
-print("PROPERTY INVESTMENT COMPARISON")
-print("="*70)
-print("\nRunning simulations for multiple properties...")
-print("(This will take a few minutes)\n")
-
-results = []
-
-for i, prop_name in enumerate(properties_to_test, 1):
-    print(f"[{i}/{len(properties_to_test)}] Analyzing {prop_name}...")
-    
-    try:
-        analysis = run_property_analysis(
-            property_name=prop_name,
-            your_cash=3500,
-            your_position=0,
-            your_properties=[],
-            opponents=[
-                {
-                    'name': 'Player 2',
-                    'cash': 1800,
-                    'position': 5,
-                    'properties': [1, 3],
-                    'risk_tolerance': 0.3
-                },
-                {
-                    'name': 'Player 3',
-                    'cash': 2200,
-                    'position': 10,
-                    'properties': [5, 15],
-                    'risk_tolerance': 0.5
-                },
-                {
-                    'name': 'Player 4',
-                    'cash': 1500,
-                    'position': 20,
-                    'properties': [],
-                    'risk_tolerance': 0.6
-                }
-            ],
-            num_simulations=500,  # Fewer simulations for speed
-            max_turns=150
-        )
-        
-        results.append({
-            'property': prop_name,
-            'price': analysis['purchase_price'],
-            'npv': analysis['npv_mean'],
-            'roi': analysis['roi'],
-            'payback': analysis['payback_mean_turns'],
-            'rent': analysis['expected_total_rent'],
-            'recommendation': analysis['recommendation']
-        })
-        
-    except Exception as e:
-        print(f"   Error analyzing {prop_name}: {e}")
-        continue
-
-# Print comparison table
-print("\n" + "="*70)
-print("INVESTMENT COMPARISON SUMMARY")
-print("="*70)
-print(f"\n{'Property':<25} {'Price':>8} {'NPV':>10} {'ROI':>8} {'Rent':>8} {'Decision':>12}")
-print("-"*70)
-
-# Sort by NPV (best investment first)
-for r in sorted(results, key=lambda x: x['npv'], reverse=True):
-    print(f"{r['property']:<25} ${r['price']:>7,.0f} ${r['npv']:>9,.0f} "
-          f"{r['roi']:>7.1f}% ${r['rent']:>7,.0f}  {r['recommendation']:>12}")
-
-print("\n" + "="*70)
-print("\n💡 Best Investment (by NPV):")
-best = max(results, key=lambda x: x['npv'])
-print(f"   {best['property']} - NPV: ${best['npv']:,.0f}, ROI: {best['roi']:.1f}%")
-
-print("\n📊 Results saved! Use this data for your analytics cards.")
+# Opponents are identical for every property analyzed
+opponents = [
+    {
+        'name': 'Player 2',
+        'cash': 1800,
+        'position': 5,
+        'properties': [1, 3],
+        'risk_tolerance': 0.3
+    },
+    {
+        'name': 'Player 3',
+        'cash': 2200,
+        'position': 10,
+        'properties': [5, 15],
+        'risk_tolerance': 0.5
+    },
+    {
+        'name': 'Player 4',
+        'cash': 1500,
+        'position': 20,
+        'properties': [],
+        'risk_tolerance': 0.6
+    }
+]
+
+
+def analyze_property(prop_name, board):
+    """Run the analysis for one property and summarize it for the comparison table"""
+    analysis = run_property_analysis(
+        property_name=prop_name,
+        your_cash=3500,
+        your_position=0,
+        your_properties=[],
+        opponents=opponents,
+        num_simulations=500,  # Fewer simulations for speed
+        max_turns=150,
+        board=board,
+        num_workers=1  # Properties already run in parallel processes (one kernel thread each)
+    )
+
+    return {
+        'property': prop_name,
+        'price': analysis['purchase_price'],
+        'npv': analysis['npv_mean'],
+        'roi': analysis['roi'],
+        'payback': analysis['payback_mean_turns'],
+        'rent': analysis['expected_total_rent'],
+        'recommendation': analysis['recommendation'],
+        'cash_flow': analysis['cash_flow_mean']
+    }
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("PROPERTY INVESTMENT COMPARISON")
+    print("="*70)
+    print("\nRunning simulations for multiple properties...")
+    print("(This will take a few minutes)\n")
+
+    # Load the board once and share it across every analysis
+    board = load_board()
+
+    # Compile the kernel (if numba is installed) before the workers start, so they
+    # load it from numba's cache instead of each compiling it cold at once
+    precompile(board)
+
+    results = []
+
+    # Each property is an independent Monte Carlo run, so analyze them in parallel
+    max_workers = min(len(properties_to_test), os.cpu_count() or 1)
+    # Spawned, not forked: numba's threading layer, started by precompile, is not fork-safe
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {executor.submit(analyze_property, prop_name, board): prop_name
+                   for prop_name in properties_to_test}
+
+        for i, future in enumerate(as_completed(futures), 1):
+            prop_name = futures[future]
+            print(f"[{i}/{len(properties_to_test)}] Finished {prop_name}")
+
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"   Error analyzing {prop_name}: {e}")
+                continue
+
+    # IRR for every property in one batch: purchase at turn 0, then the mean rent path.
+    # Shorter series are zero-padded, which leaves their IRR unchanged.
+    if results:
+        num_turns = max(len(r['cash_flow']) for r in results)
+        cash_flows = np.zeros((len(results), num_turns))
+        for row, r in zip(cash_flows, results):
+            row[:len(r['cash_flow'])] = r['cash_flow']
+            row[0] = -r['price']
+        for r, irr in zip(results, calculate_irr_batch(cash_flows)):
+            r['irr'] = irr * 100
+
+    # Print comparison table
+    print("\n" + "="*70)
+    print("INVESTMENT COMPARISON SUMMARY")
+    print("="*70)
+    print(f"\n{'Property':<25} {'Price':>8} {'NPV':>10} {'ROI':>8} {'IRR':>8} {'Rent':>8} {'Decision':>12}")
+    print("-"*79)
+
+    # Sort by NPV (best investment first)
+    for r in sorted(results, key=lambda x: x['npv'], reverse=True):
+        print(f"{r['property']:<25} ${r['price']:>7,.0f} ${r['npv']:>9,.0f} "
+              f"{r['roi']:>7.1f}% {r['irr']:>7.2f}% ${r['rent']:>7,.0f}  {r['recommendation']:>12}")
+
+    print("\n" + "="*70)
+    print("\n💡 Best Investment (by NPV):")
+    best = max(results, key=lambda x: x['npv'])
+    print(f"   {best['property']} - NPV: ${best['npv']:,.0f}, ROI: {best['roi']:.1f}%")
+
+    print("\n📊 Results saved! Use this data for your analytics cards.")
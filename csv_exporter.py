@@ -4,10 +4,131 @@ Exports simulation data in various formats for external analysis
 """
 
 import csv
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Any, Callable, Optional, Union
 from datetime import datetime
 import os
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+# Large write buffer so big exports flush in a few 1 MB writes instead of many 8 KB ones
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Every exported cell is a number, boolean or plain name, so skip the per-cell quoting
+# scan; a stray delimiter is backslash-escaped rather than quoted
+CSV_QUOTING = {'quoting': csv.QUOTE_NONE, 'escapechar': '\\'}
+
+# Result-dict keys for the simulation_runs columns between simulation_number and bought_property
+SIMULATION_RUN_KEYS = (
+    'totalInvestment',
+    'totalReturns',
+    'netProfit',
+    'roi',
+    'npv',
+    'irr',
+    'propertiesOwned',
+    'housesBuilt',
+    'hotelsBuilt',
+    'totalRentCollected',
+    'yearsSimulated',
+    'totalTurns',
+    'finalCash',
+)
+
+# Log-entry keys for the house_building_log columns after simulation_number
+HOUSE_BUILDING_LOG_KEYS = (
+    'turn',
+    'property',
+    'action',
+    'housesBefore',
+    'housesAfter',
+    'cost',
+    'expectedValue',
+    'cashAfter',
+)
+
+# Per-run results: a list of result dicts, or a DataFrame with one row per run
+# and the same keys as columns
+SimulationResults = Union[List[Dict], pd.DataFrame]
+
+
+def _results_frame(simulation_results: SimulationResults) -> pd.DataFrame:
+    """
+    Tabulate simulation results once for every per-run export
+    
+    Missing fields are filled with the same defaults the row-by-row exports used.
+    Result dicts keep each value's own type: a column mixing ints and floats
+    stays an object column, so 350 is still written "350" beside 12.5.
+    """
+    if isinstance(simulation_results, pd.DataFrame):
+        frame = simulation_results.copy()
+        for key in SIMULATION_RUN_KEYS:
+            frame[key] = frame[key].fillna(0) if key in frame else 0
+        frame['boughtProperty'] = (frame['boughtProperty'].fillna(False).astype(bool)
+                                   if 'boughtProperty' in frame else False)
+        return frame
+    
+    defaults = {**dict.fromkeys(SIMULATION_RUN_KEYS, 0), 'boughtProperty': False}
+    columns = {}
+    for key, default in defaults.items():
+        values = [result.get(key, default) for result in simulation_results]
+        columns[key] = np.array(values, dtype=object) if len(set(map(type, values))) > 1 else values
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(simulation_results)))
+
+
+def _run_values(simulation_results: SimulationResults, key: str, default) -> list:
+    """Each run's value for key (default where absent)"""
+    if isinstance(simulation_results, pd.DataFrame):
+        if key not in simulation_results:
+            return [default] * len(simulation_results)
+        return simulation_results[key].tolist()
+    return [result.get(key, default) for result in simulation_results]
+
+
+def _timestamp() -> str:
+    """Timestamp used in export filenames"""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def _median(values: np.ndarray) -> float:
+    """Middle element (upper median for even counts) via O(n) selection instead of a sort"""
+    k = values.size // 2
+    return np.partition(values, k)[k]
+
+
+def _median_element(values: np.ndarray):
+    """
+    Middle element of values kept in its own type (what sorted(values)[n//2]
+    picks), so an int median is still written as 150; O(n) selection on float keys
+    """
+    k = values.size // 2
+    return values[np.argpartition(values.astype(np.float64), k)[k]]
+
+
+def _summarize_comparison(bought, roi, npv, profit, houses, hotels, rent):
+    """
+    Means for one property's comparison row
+    
+    Returns (mean ROI, mean NPV, mean net profit, purchase rate, mean houses,
+    mean hotels, mean rent). Compiled with numba when it is installed.
+    """
+    return (
+        roi.mean(), npv.mean(), profit.mean(),
+        bought.mean() * 100,
+        houses.mean(),
+        hotels.mean(),
+        rent.mean(),
+    )
+
+
+if njit is not None:
+    _summarize_comparison = njit(cache=True)(_summarize_comparison)
+
 
 class MonopolyCSVExporter:
     """Handles all CSV export functionality for Monopoly simulations"""
@@ -20,22 +141,30 @@ class MonopolyCSVExporter:
             output_dir: Directory to save CSV files (created if doesn't exist)
         """
         self.output_dir = output_dir
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
     
-    def export_simulation_runs(self, simulation_results: List[Dict], 
-                              property_name: str = "property") -> str:
+    def export_simulation_runs(self, simulation_results: SimulationResults, 
+                              property_name: str = "property",
+                              timestamp: Optional[str] = None,
+                              frame: Optional[pd.DataFrame] = None,
+                              log: Callable[[str], Any] = print) -> str:
         """
         Export individual simulation runs - each row is one complete game
         
         Args:
-            simulation_results: List of simulation result dictionaries
+            simulation_results: Simulation result dictionaries (or their DataFrame)
             property_name: Name of property being analyzed
+            timestamp: Filename timestamp (defaults to now)
+            frame: _results_frame(simulation_results), if already built
+            log: Takes the status line (print by default)
             
         Returns:
             Path to the created CSV file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = _timestamp()
+        if frame is None:
+            frame = _results_frame(simulation_results)
         filename = f"{self.output_dir}/simulation_runs_{property_name}_{timestamp}.csv"
         
         headers = [
@@ -56,95 +185,104 @@ class MonopolyCSVExporter:
             'bought_property'
         ]
         
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            for i, result in enumerate(simulation_results, 1):
-                row = {
-                    'simulation_number': i,
-                    'total_investment': result.get('totalInvestment', 0),
-                    'total_returns': result.get('totalReturns', 0),
-                    'net_profit': result.get('netProfit', 0),
-                    'roi_percent': result.get('roi', 0),
-                    'npv': result.get('npv', 0),
-                    'irr_percent': result.get('irr', 0),
-                    'properties_owned': result.get('propertiesOwned', 0),
-                    'houses_built': result.get('housesBuilt', 0),
-                    'hotels_built': result.get('hotelsBuilt', 0),
-                    'total_rent_collected': result.get('totalRentCollected', 0),
-                    'years_simulated': result.get('yearsSimulated', 0),
-                    'total_turns': result.get('totalTurns', 0),
-                    'final_cash': result.get('finalCash', 0),
-                    'bought_property': result.get('boughtProperty', False)
-                }
-                writer.writerow(row)
+        runs = frame[[*SIMULATION_RUN_KEYS, 'boughtProperty']]
+        runs = runs.set_axis(headers[1:], axis=1).set_axis(pd.RangeIndex(1, len(runs) + 1))
+        
+        with open(filename, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            # pandas' C writer; \r\n matches the csv module's default line ending
+            runs.to_csv(f, index_label=headers[0], lineterminator='\r\n',
+                        **CSV_QUOTING)
         
-        print(f"✅ Exported {len(simulation_results)} simulation runs to: {filename}")
+        log(f"✅ Exported {len(simulation_results)} simulation runs to: {filename}")
         return filename
     
-    def export_cash_flow_timeline(self, simulation_results: List[Dict], 
-                                  property_name: str = "property") -> str:
+    def export_cash_flow_timeline(self, simulation_results: SimulationResults, 
+                                  property_name: str = "property",
+                                  timestamp: Optional[str] = None,
+                                  cash_flows: Optional[np.ndarray] = None,
+                                  log: Callable[[str], Any] = print) -> str:
         """
         Export turn-by-turn cash flow data across all simulations
         
         Args:
-            simulation_results: List of simulation result dictionaries
+            simulation_results: Simulation result dictionaries (or their DataFrame)
             property_name: Name of property being analyzed
+            timestamp: Filename timestamp (defaults to now)
+            cash_flows: Simulations x turns array, NaN past each game's end; read
+                from the results' cashFlowByTurn if None
+            log: Takes the status line (print by default)
             
         Returns:
             Path to the created CSV file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = _timestamp()
         filename = f"{self.output_dir}/cash_flow_timeline_{property_name}_{timestamp}.csv"
         
-        # Find the maximum number of turns across all simulations
-        max_turns = max((len(result.get('cashFlowByTurn', [])) 
-                        for result in simulation_results), default=0)
+        if cash_flows is not None:
+            # Already a padded grid: write it turns x simulations
+            grid = cash_flows.T
+        else:
+            # Look up each simulation's cash flow once
+            flows = _run_values(simulation_results, 'cashFlowByTurn', [])
+            
+            # Fill a turns x simulations grid column by column; shorter games stay
+            # NaN and are written as blank cells. An object grid keeps each value's
+            # own type, so an int cash flow is still written as 26, not 26.0
+            grid = np.full((max((len(cash_flow) for cash_flow in flows), default=0), len(flows)),
+                           np.nan, dtype=object)
+            for j, cash_flow in enumerate(flows):
+                grid[:len(cash_flow), j] = cash_flow
+        
+        # The maximum number of turns across all simulations
+        max_turns, num_runs = grid.shape
         
         if max_turns == 0:
-            print("⚠️  No cash flow timeline data available")
+            log("⚠️  No cash flow timeline data available")
             return None
         
-        headers = ['turn'] + [f'sim_{i+1}' for i in range(len(simulation_results))]
-        
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
+        with open(filename, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f, **CSV_QUOTING)
+            writer.writerow(['turn', *(f'sim_{i+1}' for i in range(num_runs))])
             
-            for turn in range(max_turns):
-                row = [turn + 1]
-                for result in simulation_results:
-                    cash_flow = result.get('cashFlowByTurn', [])
-                    value = cash_flow[turn] if turn < len(cash_flow) else ''
-                    row.append(value)
-                writer.writerow(row)
+            # All-numeric rows: join each value's text (what pandas' writer emits)
+            # directly, blanking NaN cells; about 3x faster than DataFrame.to_csv
+            f.writelines(f'{turn},' + ','.join(map(str, row)).replace('nan', '') + '\r\n'
+                         for turn, row in enumerate(grid.tolist(), 1))
         
-        print(f"✅ Exported cash flow timeline ({max_turns} turns) to: {filename}")
+        log(f"✅ Exported cash flow timeline ({max_turns} turns) to: {filename}")
         return filename
     
-    def export_property_statistics(self, simulation_results: List[Dict],
-                                   property_name: str = "property") -> str:
+    def export_property_statistics(self, simulation_results: SimulationResults,
+                                   property_name: str = "property",
+                                   timestamp: Optional[str] = None,
+                                   frame: Optional[pd.DataFrame] = None,
+                                   log: Callable[[str], Any] = print) -> str:
         """
         Export aggregated statistics across all simulations
         
         Args:
-            simulation_results: List of simulation result dictionaries
+            simulation_results: Simulation result dictionaries (or their DataFrame)
             property_name: Name of property being analyzed
+            timestamp: Filename timestamp (defaults to now)
+            frame: _results_frame(simulation_results), if already built
+            log: Takes the status line (print by default)
             
         Returns:
             Path to the created CSV file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = _timestamp()
+        if frame is None:
+            frame = _results_frame(simulation_results)
         filename = f"{self.output_dir}/property_statistics_{property_name}_{timestamp}.csv"
         
-        # Calculate statistics
-        total_sims = len(simulation_results)
-        bought_count = sum(1 for r in simulation_results if r.get('boughtProperty', False))
-        
-        roi_values = [r.get('roi', 0) for r in simulation_results]
-        npv_values = [r.get('npv', 0) for r in simulation_results]
-        net_profit_values = [r.get('netProfit', 0) for r in simulation_results]
+        # Calculate statistics from the frame's metric columns
+        total_sims = len(frame)
+        roi_values = frame['roi'].to_numpy(dtype=np.float64)
+        npv_values = frame['npv'].to_numpy(dtype=np.float64)
+        net_profit_values = frame['netProfit'].to_numpy(dtype=np.float64)
+        bought_count = int(frame['boughtProperty'].sum())
         
         stats = [
             ('Property Name', property_name),
@@ -154,46 +292,51 @@ class MonopolyCSVExporter:
             ('Times Not Purchased', total_sims - bought_count),
             ('', ''),
             ('ROI Statistics', ''),
-            ('Mean ROI (%)', f"{sum(roi_values)/len(roi_values):.2f}" if roi_values else "0"),
-            ('Median ROI (%)', f"{sorted(roi_values)[len(roi_values)//2]:.2f}" if roi_values else "0"),
-            ('Min ROI (%)', f"{min(roi_values):.2f}" if roi_values else "0"),
-            ('Max ROI (%)', f"{max(roi_values):.2f}" if roi_values else "0"),
+            ('Mean ROI (%)', f"{roi_values.mean():.2f}" if roi_values.size else "0"),
+            ('Median ROI (%)', f"{_median(roi_values):.2f}" if roi_values.size else "0"),
+            ('Min ROI (%)', f"{roi_values.min():.2f}" if roi_values.size else "0"),
+            ('Max ROI (%)', f"{roi_values.max():.2f}" if roi_values.size else "0"),
             ('', ''),
             ('NPV Statistics', ''),
-            ('Mean NPV ($)', f"{sum(npv_values)/len(npv_values):.2f}" if npv_values else "0"),
-            ('Median NPV ($)', f"{sorted(npv_values)[len(npv_values)//2]:.2f}" if npv_values else "0"),
-            ('Min NPV ($)', f"{min(npv_values):.2f}" if npv_values else "0"),
-            ('Max NPV ($)', f"{max(npv_values):.2f}" if npv_values else "0"),
+            ('Mean NPV ($)', f"{npv_values.mean():.2f}" if npv_values.size else "0"),
+            ('Median NPV ($)', f"{_median(npv_values):.2f}" if npv_values.size else "0"),
+            ('Min NPV ($)', f"{npv_values.min():.2f}" if npv_values.size else "0"),
+            ('Max NPV ($)', f"{npv_values.max():.2f}" if npv_values.size else "0"),
             ('', ''),
             ('Net Profit Statistics', ''),
-            ('Mean Net Profit ($)', f"{sum(net_profit_values)/len(net_profit_values):.2f}" if net_profit_values else "0"),
-            ('Median Net Profit ($)', f"{sorted(net_profit_values)[len(net_profit_values)//2]:.2f}" if net_profit_values else "0"),
-            ('Min Net Profit ($)', f"{min(net_profit_values):.2f}" if net_profit_values else "0"),
-            ('Max Net Profit ($)', f"{max(net_profit_values):.2f}" if net_profit_values else "0")
+            ('Mean Net Profit ($)', f"{net_profit_values.mean():.2f}" if net_profit_values.size else "0"),
+            ('Median Net Profit ($)', f"{_median(net_profit_values):.2f}" if net_profit_values.size else "0"),
+            ('Min Net Profit ($)', f"{net_profit_values.min():.2f}" if net_profit_values.size else "0"),
+            ('Max Net Profit ($)', f"{net_profit_values.max():.2f}" if net_profit_values.size else "0")
         ]
         
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
+        with open(filename, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f, **CSV_QUOTING)
             writer.writerow(['Metric', 'Value'])
             for metric, value in stats:
                 writer.writerow([metric, value])
         
-        print(f"✅ Exported property statistics to: {filename}")
+        log(f"✅ Exported property statistics to: {filename}")
         return filename
     
-    def export_house_building_log(self, simulation_results: List[Dict],
-                                  property_name: str = "property") -> str:
+    def export_house_building_log(self, simulation_results: SimulationResults,
+                                  property_name: str = "property",
+                                  timestamp: Optional[str] = None,
+                                  log: Callable[[str], Any] = print) -> str:
         """
         Export house/hotel building decisions from simulations
         
         Args:
-            simulation_results: List of simulation result dictionaries
+            simulation_results: Simulation result dictionaries (or their DataFrame)
             property_name: Name of property being analyzed
+            timestamp: Filename timestamp (defaults to now)
+            log: Takes the status line (print by default)
             
         Returns:
             Path to the created CSV file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = _timestamp()
         filename = f"{self.output_dir}/house_building_log_{property_name}_{timestamp}.csv"
         
         headers = [
@@ -208,43 +351,34 @@ class MonopolyCSVExporter:
             'player_cash_after'
         ]
         
-        rows_written = 0
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            for i, result in enumerate(simulation_results, 1):
-                building_log = result.get('houseBuildingLog', [])
-                for entry in building_log:
-                    row = {
-                        'simulation_number': i,
-                        'turn': entry.get('turn', ''),
-                        'property_name': entry.get('property', ''),
-                        'action': entry.get('action', ''),
-                        'houses_before': entry.get('housesBefore', ''),
-                        'houses_after': entry.get('housesAfter', ''),
-                        'cost': entry.get('cost', ''),
-                        'expected_value': entry.get('expectedValue', ''),
-                        'player_cash_after': entry.get('cashAfter', '')
-                    }
-                    writer.writerow(row)
-                    rows_written += 1
+        rows = [
+            (i, *(entry.get(key, '') for key in HOUSE_BUILDING_LOG_KEYS))
+            for i, building_log in enumerate(_run_values(simulation_results, 'houseBuildingLog', []), 1)
+            for entry in building_log
+        ]
+        rows_written = len(rows)
+        with open(filename, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f, **CSV_QUOTING)
+            writer.writerow(headers)
+            writer.writerows(rows)
         
         if rows_written > 0:
-            print(f"✅ Exported {rows_written} house building decisions to: {filename}")
+            log(f"✅ Exported {rows_written} house building decisions to: {filename}")
         else:
-            print(f"⚠️  No house building data available")
+            log(f"⚠️  No house building data available")
         
         return filename if rows_written > 0 else None
     
-    def export_all(self, simulation_results: List[Dict], 
-                   property_name: str = "property") -> Dict[str, str]:
+    def export_all(self, simulation_results: SimulationResults, 
+                   property_name: str = "property",
+                   cash_flows: Optional[np.ndarray] = None) -> Dict[str, str]:
         """
         Export all available CSV formats
         
         Args:
-            simulation_results: List of simulation result dictionaries
+            simulation_results: Simulation result dictionaries (or their DataFrame)
             property_name: Name of property being analyzed
+            cash_flows: Padded cash-flow grid for export_cash_flow_timeline, if at hand
             
         Returns:
             Dictionary mapping export type to filename
@@ -253,31 +387,43 @@ class MonopolyCSVExporter:
         print(f"   Total simulations: {len(simulation_results)}")
         print(f"   Output directory: {self.output_dir}/\n")
         
-        exported_files = {}
-        
-        # Export simulation runs
-        exported_files['simulation_runs'] = self.export_simulation_runs(
-            simulation_results, property_name
-        )
+        # One timestamp so every file from this run shares it
+        timestamp = _timestamp()
         
-        # Export cash flow timeline
-        cash_flow_file = self.export_cash_flow_timeline(
-            simulation_results, property_name
-        )
-        if cash_flow_file:
-            exported_files['cash_flow_timeline'] = cash_flow_file
+        # Tabulate the results once for the exports that read per-run fields
+        frame = _results_frame(simulation_results)
         
-        # Export property statistics
-        exported_files['property_statistics'] = self.export_property_statistics(
-            simulation_results, property_name
-        )
+        # The exports are independent (separate files, read-only inputs), so run them
+        # concurrently; file writes and NumPy reductions overlap across threads. Each
+        # keeps its status lines, printed once it finishes, so output doesn't interleave
+        exports = {
+            'simulation_runs': self.export_simulation_runs,
+            'cash_flow_timeline': self.export_cash_flow_timeline,
+            'property_statistics': self.export_property_statistics,
+            'house_building_log': self.export_house_building_log,
+        }
+        frame_kwargs = {
+            'simulation_runs': {'frame': frame},
+            'cash_flow_timeline': {'cash_flows': cash_flows},
+            'property_statistics': {'frame': frame},
+        }
+        messages = {export_type: [] for export_type in exports}
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            futures = {
+                export_type: executor.submit(export, simulation_results, property_name, timestamp,
+                                             log=messages[export_type].append,
+                                             **frame_kwargs.get(export_type, {}))
+                for export_type, export in exports.items()
+            }
         
-        # Export house building log
-        house_log_file = self.export_house_building_log(
-            simulation_results, property_name
-        )
-        if house_log_file:
-            exported_files['house_building_log'] = house_log_file
+        # Cash flow timeline and house building log return None when there is no data
+        exported_files = {}
+        for export_type, future in futures.items():
+            filename = future.result()
+            for message in messages[export_type]:
+                print(message)
+            if filename:
+                exported_files[export_type] = filename
         
         print(f"\n✅ All exports complete! {len(exported_files)} files created.\n")
         return exported_files
@@ -295,11 +441,10 @@ def export_comparison_csv(properties_data: Dict[str, List[Dict]],
     Returns:
         Path to the created CSV file
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _timestamp()
     filename = f"{output_dir}/property_comparison_{timestamp}.csv"
     
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
     headers = [
         'property_name',
@@ -316,37 +461,28 @@ def export_comparison_csv(properties_data: Dict[str, List[Dict]],
         'mean_rent_collected'
     ]
     
-    with open(filename, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
+    with open(filename, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, **CSV_QUOTING)
+        writer.writerow(headers)
         
         for property_name, results in properties_data.items():
             if not results:
                 continue
             
-            bought_count = sum(1 for r in results if r.get('boughtProperty', False))
-            roi_values = [r.get('roi', 0) for r in results]
-            npv_values = [r.get('npv', 0) for r in results]
-            profit_values = [r.get('netProfit', 0) for r in results]
-            houses_values = [r.get('housesBuilt', 0) for r in results]
-            hotels_values = [r.get('hotelsBuilt', 0) for r in results]
-            rent_values = [r.get('totalRentCollected', 0) for r in results]
+            # Column arrays from the tabulated results, one float64 buffer per metric
+            # for the means; medians are picked from the source columns
+            frame = _results_frame(results)
+            columns = ('boughtProperty', 'roi', 'npv', 'netProfit',
+                       'housesBuilt', 'hotelsBuilt', 'totalRentCollected')
             
-            row = {
-                'property_name': property_name,
-                'num_simulations': len(results),
-                'mean_roi_percent': sum(roi_values) / len(roi_values) if roi_values else 0,
-                'median_roi_percent': sorted(roi_values)[len(roi_values)//2] if roi_values else 0,
-                'mean_npv': sum(npv_values) / len(npv_values) if npv_values else 0,
-                'median_npv': sorted(npv_values)[len(npv_values)//2] if npv_values else 0,
-                'mean_net_profit': sum(profit_values) / len(profit_values) if profit_values else 0,
-                'median_net_profit': sorted(profit_values)[len(profit_values)//2] if profit_values else 0,
-                'purchase_rate_percent': (bought_count / len(results) * 100) if results else 0,
-                'mean_houses_built': sum(houses_values) / len(houses_values) if houses_values else 0,
-                'mean_hotels_built': sum(hotels_values) / len(hotels_values) if hotels_values else 0,
-                'mean_rent_collected': sum(rent_values) / len(rent_values) if rent_values else 0
-            }
-            writer.writerow(row)
+            mean_roi, mean_npv, mean_profit, *rest = _summarize_comparison(
+                *(frame[column].to_numpy(dtype=np.float64) for column in columns)
+            )
+            median_roi, median_npv, median_profit = (
+                _median_element(frame[column].to_numpy()) for column in ('roi', 'npv', 'netProfit')
+            )
+            writer.writerow((property_name, len(frame), mean_roi, median_roi, mean_npv, median_npv,
+                             mean_profit, median_profit, *rest))
     
     print(f"✅ Exported property comparison to: {filename}")
     return filename
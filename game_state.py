@@ -1,18 +1,23 @@
 """
 Player and game state management
 """
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from properties import MonopolyBoard, Property
 
-@dataclass
+BOARD_SIZE = 40
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game"""
     name: str
     cash: float
     position: int = 0
-    owned_properties: List[int] = field(default_factory=list)
-    houses: Dict[int, int] = field(default_factory=dict)  # position -> num_houses (5 = hotel)
+    owned_properties: FrozenSet[int] = frozenset()  # Read-only: change it through add_property
+    property_version: int = 0  # Bumped whenever owned_properties changes
+    owned_mask: int = field(default=0, init=False)  # Bit p set when position p is owned
+    houses: array = field(default_factory=lambda: array('B', bytes(BOARD_SIZE)))  # position -> num_houses (5 = hotel)
     in_jail: bool = False
     jail_turns: int = 0
     is_bankrupt: bool = False
@@ -21,6 +26,12 @@ class Player:
     risk_tolerance: float = 0.5  # 0-1, higher = more aggressive
     min_cash_reserve: float = 200.0  # Minimum cash to keep on hand
     
+    def __post_init__(self):
+        """Freeze the starting properties and build the ownership bitmask from them"""
+        self.owned_properties = frozenset(self.owned_properties)
+        for pos in self.owned_properties:
+            self.owned_mask |= 1 << pos
+    
     def can_afford(self, amount: float) -> bool:
         """Check if player can afford a purchase while maintaining reserve"""
         return (self.cash - amount) >= self.min_cash_reserve
@@ -39,32 +50,50 @@ class Player:
     
     def buy_property(self, position: int, price: float) -> bool:
         """Attempt to buy a property"""
-        if not self.can_afford(price):
+        # can_afford, inlined: this runs for every purchase in every simulated game
+        if self.cash - price < self.min_cash_reserve:
             return False
         
         self.cash -= price
-        self.owned_properties.append(position)
-        self.houses[position] = 0  # No houses initially
+        self.add_property(position)
         return True
     
+    def add_property(self, position: int):
+        """
+        Take ownership of a property, keeping owned_mask and property_version in step
+        
+        owned_properties is a frozenset so this is the only way it changes; go
+        through GameState.buy_property or GameState.give_property in a game so
+        its owners index follows too.
+        """
+        self.owned_properties = self.owned_properties | {position}
+        self.owned_mask |= 1 << position
+        self.property_version += 1
+    
     def owns_property(self, position: int) -> bool:
         """Check if player owns a property"""
-        return position in self.owned_properties
+        return (self.owned_mask >> position) & 1 == 1
+    
+    def count_owned(self, positions_mask: int) -> int:
+        """Count owned properties among the positions set in a bitmask"""
+        return (self.owned_mask & positions_mask).bit_count()
     
     def get_total_properties(self) -> int:
         """Count total owned properties"""
         return len(self.owned_properties)
     
-    def move(self, spaces: int, board_size: int = 40) -> bool:
-        """Move player on board. Returns True if passed GO"""
-        old_position = self.position
-        self.position = (self.position + spaces) % board_size
-        
-        # Check if passed GO
-        return self.position < old_position
+    def move(self, spaces: int, board_size: int = BOARD_SIZE) -> bool:
+        """Move player forward 0 to board_size - 1 spaces. Returns True if passed GO"""
+        # Compare-and-subtract wrap instead of a modulo; most moves don't wrap
+        new_position = self.position + spaces
+        passed_go = new_position >= board_size
+        if passed_go:
+            new_position -= board_size
+        self.position = new_position
+        return passed_go
     
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Represents the complete state of a Monopoly game"""
     board: MonopolyBoard
@@ -72,6 +101,13 @@ class GameState:
     current_turn: int = 0
     current_player_idx: int = 0
     total_turns: int = 0  # Total turns taken by all players
+    owners: Dict[int, Player] = field(default_factory=dict)  # position -> owning player
+    
+    def __post_init__(self):
+        """Index starting ownership (first listed owner wins, as in a player scan)"""
+        for player in self.players:
+            for pos in player.owned_properties:
+                self.owners.setdefault(pos, player)
     
     def get_current_player(self) -> Player:
         """Get the player whose turn it is"""
@@ -86,29 +122,52 @@ class GameState:
     
     def get_property_owner(self, position: int) -> Optional[Player]:
         """Find who owns a property, if anyone"""
-        for player in self.players:
-            if player.owns_property(position):
-                return player
-        return None
+        return self.owners.get(position)
+    
+    def buy_property(self, player: Player, position: int, price: float) -> bool:
+        """Attempt a purchase for player, recording the new owner on success"""
+        if not player.buy_property(position, price):
+            return False
+        self.owners[position] = player
+        return True
+    
+    def give_property(self, player: Player, position: int):
+        """Hand an unowned property to player without payment"""
+        player.add_property(position)
+        self.owners[position] = player
     
     def get_active_players(self) -> List[Player]:
         """Get players who are not bankrupt"""
         return [p for p in self.players if not p.is_bankrupt]
     
+    def _sole_active_player(self) -> Tuple[int, Optional[Player]]:
+        """
+        Count active players, stopping at 2
+        
+        Returns (count, player) where player is the only active one when count == 1
+        """
+        count = 0
+        survivor = None
+        for p in self.players:
+            if not p.is_bankrupt:
+                count += 1
+                if count > 1:
+                    return count, None
+                survivor = p
+        return count, survivor
+    
     def is_game_over(self) -> bool:
         """Check if game is over (only 1 player remaining)"""
-        return len(self.get_active_players()) <= 1
+        return self._sole_active_player()[0] <= 1
     
     def get_winner(self) -> Optional[Player]:
         """Get the winner, if game is over"""
-        active = self.get_active_players()
-        if len(active) == 1:
-            return active[0]
-        return None
+        return self._sole_active_player()[1]
     
     def player_has_monopoly(self, player: Player, color: str) -> bool:
         """Check if player has a color monopoly"""
-        return self.board.has_monopoly(player.owned_properties, color)
+        group_mask = self.board.color_masks.get(color, 0)
+        return group_mask != 0 and (player.owned_mask & group_mask) == group_mask
 
 
 def create_game(board: MonopolyBoard, 
@@ -124,13 +183,10 @@ def create_game(board: MonopolyBoard,
             name=config.get('name', 'Player'),
             cash=config.get('cash', 1500),
             position=config.get('position', 0),
-            owned_properties=config.get('owned_properties', []).copy(),
+            owned_properties=set(config.get('owned_properties', [])),
             risk_tolerance=config.get('risk_tolerance', 0.5),
             min_cash_reserve=config.get('min_cash_reserve', 200)
         )
-        # Initialize houses dict for owned properties
-        for pos in player.owned_properties:
-            player.houses[pos] = 0
         players.append(player)
     
     return GameState(board=board, players=players)
@@ -191,7 +247,7 @@ if __name__ == '__main__':
     player = game.players[0]
     prop = board.get_property(nc_ave_pos)
     print(f"\n{player.name} attempting to buy {prop.name} for ${prop.purchase_price}")
-    if player.buy_property(nc_ave_pos, prop.purchase_price):
+    if game.buy_property(player, nc_ave_pos, prop.purchase_price):
         print(f"  Success! {player.name} now has ${player.cash}")
         print(f"  Total properties: {player.get_total_properties()}")
     else:
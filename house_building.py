@@ -1,17 +1,95 @@
 """
 House Building Engine - Optimal property development using analytical expected value
 """
+import functools
+import heapq
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
+import numpy as np
 from properties import MonopolyBoard
-from game_state import Player, GameState
+from game_state import BOARD_SIZE, Player, GameState
 
-@dataclass
+
+def _landing_probabilities() -> np.ndarray:
+    """
+    Calculate landing probabilities for all board positions
+    
+    Based on:
+    - Dice distribution (2d6, peak at 7)
+    - Jail effect (boosts Orange properties significantly)
+    - Strategic position effects
+    
+    Returns:
+        Read-only array indexed by board position
+    """
+    # Base probability (if board were uniform)
+    probs = np.full(BOARD_SIZE, 1.0 / BOARD_SIZE)  # 2.5%
+    
+    # Orange properties (16-19) get significant boost from Jail at position 10
+    # Players leaving jail (positions 10) most commonly land on 16-19
+    probs[16:20] *= 1.25  # 25% boost
+    
+    # Red properties also benefit slightly
+    probs[21:25] *= 1.10
+    
+    # Railroads are strategically positioned
+    probs[[5, 15, 25, 35]] *= 1.05
+    
+    # Go To Jail (position 30) - never landed on, always sent to Jail
+    probs[30] = 0.0
+    
+    # Jail (position 10) - higher probability (people sent here)
+    probs[10] *= 1.5
+    
+    # Normalize so probabilities sum to 1.0
+    probs /= probs.sum()
+    probs.flags.writeable = False
+    return probs
+
+
+# Board-independent, so computed once at import and shared by every engine
+LANDING_PROBS = _landing_probabilities()
+
+# Development levels: 0 houses through hotel (5)
+MAX_DEVELOPMENT = 5
+
+# Integer codes for color groups, resolved once per option so preference checks
+# compare ints; groups missing from this table get UNKNOWN_COLOR_ID
+COLOR_IDS = {
+    'Brown': 0,
+    'Powder Blue': 1,
+    'Purple': 2,
+    'Orange': 3,
+    'Red': 4,
+    'Yellow': 5,
+    'Green': 6,
+    'Blue': 7,
+}
+UNKNOWN_COLOR_ID = -1
+
+
+@functools.lru_cache(maxsize=8)
+def _monopoly_rent_table(board: MonopolyBoard) -> np.ndarray:
+    """
+    Monopoly rent at every development level: table[position, houses]
+    
+    Cached per board, so the engine each simulated game creates reuses it.
+    """
+    table = np.array([
+        [board.get_property(pos).get_rent(has_monopoly=True, houses=houses)
+         for houses in range(MAX_DEVELOPMENT + 1)]
+        for pos in range(len(board.properties))
+    ])
+    table.flags.writeable = False
+    return table
+
+@dataclass(slots=True)
 class DevelopmentOption:
     """Represents a potential house/hotel purchase"""
     property_positions: List[int]  # Can be multiple for group builds
     property_name: str
     color_group: str
+    color_id: int  # COLOR_IDS code for color_group
     current_houses: int
     new_houses: int
     cost: float
@@ -27,8 +105,11 @@ class HouseBuildingEngine:
     
     def __init__(self, board: MonopolyBoard):
         self.board = board
-        # Pre-calculate landing probabilities (one-time cost)
-        self.landing_probs = self._calculate_landing_probabilities()
+        self.landing_probs = LANDING_PROBS
+        self.rent_table = _monopoly_rent_table(board)
+        # id(player) -> (player, property_version, monopolies); holding the player
+        # keeps its id from being reused while the entry exists
+        self._monopoly_cache: Dict[int, Tuple[Player, int, Dict[str, List[int]]]] = {}
     
     def decide_development(self, 
                           player: Player, 
@@ -62,80 +143,57 @@ class HouseBuildingEngine:
         if not options:
             return []
         
-        # 4. Calculate Expected Value for each option
-        num_opponents = len([p for p in game_state.players if not p.is_bankrupt and p != player])
+        # 4. Calculate Expected Value for every option at once
+        # EV = Rent_Increase × Landing_Probability × Remaining_Turns × Num_Opponents:
+        # how much additional rent we expect to collect over the remaining game
+        num_opponents = sum(1 for p in game_state.players if not p.is_bankrupt and p is not player)
+        # Each opponent has landing_prob chance of landing each turn
+        opponent_turns = estimated_remaining_turns * num_opponents
         
-        for option in options:
-            option.expected_value = self._calculate_expected_value(
-                option,
-                estimated_remaining_turns,
-                num_opponents
-            )
-            option.ev_per_dollar = option.expected_value / option.cost if option.cost > 0 else 0
+        count = len(options)
+        # Primary property of each option
+        positions = np.fromiter((option.property_positions[0] for option in options),
+                                dtype=np.int64, count=count)
+        rent_increases = np.fromiter((option.rent_increase for option in options),
+                                     dtype=np.float64, count=count)
+        costs = np.fromiter((option.cost for option in options), dtype=np.float64, count=count)
+        
+        expected_values = rent_increases * (self.landing_probs[positions] * opponent_turns)
+        ev_per_dollar = np.divide(expected_values, costs,
+                                  out=np.zeros_like(expected_values), where=costs > 0)
         
         # 5. Apply strategic preferences
-        self._apply_strategic_preferences(options, player)
+        ev_per_dollar *= self._strategic_multipliers(options, costs, player)
+        
+        for option, ev, evpd in zip(options, expected_values.tolist(), ev_per_dollar.tolist()):
+            option.expected_value = ev
+            option.ev_per_dollar = evpd
         
         # 6. Greedy selection: Pick best ROI options within budget
-        selected = self._greedy_selection(options, available_cash)
+        selected = self._greedy_selection(options, ev_per_dollar, available_cash)
         
         return selected
     
     def _get_player_monopolies(self, player: Player, game_state: GameState) -> Dict[str, List[int]]:
-        """Find which color groups the player has monopolies in"""
-        monopolies = {}
-        
-        for color, positions in self.board.color_groups.items():
-            # Check if player owns all properties in this color group
-            if all(player.owns_property(pos) for pos in positions):
-                monopolies[color] = positions
-        
-        return monopolies
-    
-    def _calculate_landing_probabilities(self) -> Dict[int, float]:
         """
-        Calculate landing probabilities for all board positions
+        Find which color groups the player has monopolies in
         
-        Based on:
-        - Dice distribution (2d6, peak at 7)
-        - Jail effect (boosts Orange properties significantly)
-        - Strategic position effects
+        Cached until the player's ownership changes; callers must not mutate the result.
         """
-        probs = {}
+        cached = self._monopoly_cache.get(id(player))
+        if cached is not None and cached[0] is player and cached[1] == player.property_version:
+            return cached[2]
         
-        # Base probability (if board were uniform)
-        base_prob = 1.0 / 40  # 2.5%
+        monopolies = {}
+        owned_mask = player.owned_mask
         
-        for pos in range(40):
-            prop = self.board.get_property(pos)
-            
-            # Orange properties (16-19) get significant boost from Jail at position 10
-            # Players leaving jail (positions 10) most commonly land on 16-19
-            if 16 <= pos <= 19:
-                probs[pos] = base_prob * 1.25  # 25% boost
-            
-            # Red properties also benefit slightly
-            elif 21 <= pos <= 24:
-                probs[pos] = base_prob * 1.10
-            
-            # Railroads are strategically positioned
-            elif pos in [5, 15, 25, 35]:
-                probs[pos] = base_prob * 1.05
-            
-            # Go To Jail (position 30) - never landed on, always sent to Jail
-            elif pos == 30:
-                probs[pos] = 0.0
-            
-            # Jail (position 10) - higher probability (people sent here)
-            elif pos == 10:
-                probs[pos] = base_prob * 1.5
-            
-            else:
-                probs[pos] = base_prob
+        for color, group_mask in self.board.color_masks.items():
+            # Check if player owns all properties in this color group
+            if (owned_mask & group_mask) == group_mask:
+                monopolies[color] = self.board.color_groups[color]
         
-        # Normalize so probabilities sum to 1.0
-        total = sum(probs.values())
-        return {k: v/total for k, v in probs.items()}
+        self._monopoly_cache[id(player)] = (player, player.property_version, monopolies)
+        return monopolies
     
     def _generate_development_options(self, 
                                      player: Player, 
@@ -146,23 +204,31 @@ class HouseBuildingEngine:
         Respects Monopoly's even-building rule
         """
         options = []
+        houses = player.houses
         
         for color, positions in monopolies.items():
-            # Get current development state for this color group
-            current_houses = [player.houses.get(pos, 0) for pos in positions]
+            color_id = COLOR_IDS.get(color, UNKNOWN_COLOR_ID)
+            
+            # Snapshot current development state for this color group
+            current_houses = [houses[pos] for pos in positions]
             min_houses = min(current_houses)
-            max_houses = max(current_houses)
             
             # Even building rule: Can only build where you have the minimum
             # Can't build if already at hotel level (5)
-            if min_houses >= 5:
+            if min_houses >= MAX_DEVELOPMENT:
                 continue
             
             # Option: Build one house on each minimally-developed property
-            properties_to_build = [pos for pos in positions 
-                                  if player.houses.get(pos, 0) == min_houses]
+            properties_to_build = [pos for pos, count in zip(positions, current_houses)
+                                  if count == min_houses]
             
             for pos in properties_to_build:
+                # Calculate rent increase; a level that raises no rent has no value
+                old_rent, new_rent = self.rent_table[pos, min_houses:min_houses + 2].tolist()
+                if new_rent <= old_rent:
+                    continue
+                rent_increase = new_rent - old_rent
+                
                 prop = self.board.get_property(pos)
                 
                 # Determine cost (houses vs hotel)
@@ -173,17 +239,13 @@ class HouseBuildingEngine:
                     cost = prop.house_cost  # Hotel costs same as house in standard rules
                     is_hotel = True
                 
-                # Calculate rent increase
-                old_rent = prop.get_rent(has_monopoly=True, houses=min_houses)
-                new_rent = prop.get_rent(has_monopoly=True, houses=min_houses + 1)
-                rent_increase = new_rent - old_rent
-                
                 house_word = "hotel" if is_hotel else "house"
                 
                 option = DevelopmentOption(
                     property_positions=[pos],
                     property_name=prop.name,
                     color_group=color,
+                    color_id=color_id,
                     current_houses=min_houses,
                     new_houses=min_houses + 1,
                     cost=cost,
@@ -197,99 +259,88 @@ class HouseBuildingEngine:
         
         return options
     
-    def _calculate_expected_value(self,
-                                  option: DevelopmentOption,
-                                  remaining_turns: int,
-                                  num_opponents: int) -> float:
+    def _strategic_multipliers(self,
+                               options: List[DevelopmentOption],
+                               costs: np.ndarray,
+                               player: Player) -> np.ndarray:
         """
-        Calculate Expected Value for a development option
-        
-        EV = Rent_Increase × Landing_Probability × Remaining_Turns × Num_Opponents
+        Strategic preferences to boost/penalize certain options
         
-        This is the key metric: how much additional rent we expect to collect
-        from this investment over the remaining game
+        Returns:
+            Per-option multiplier for ev_per_dollar
         """
-        property_pos = option.property_positions[0]  # Primary property
+        count = len(options)
+        is_hotel = np.fromiter((option.is_hotel for option in options), dtype=bool, count=count)
+        color_ids = np.fromiter((option.color_id for option in options), dtype=np.int8, count=count)
+        is_orange = color_ids == COLOR_IDS['Orange']
+        is_red_or_yellow = (color_ids == COLOR_IDS['Red']) | (color_ids == COLOR_IDS['Yellow'])
+        is_first_house = np.fromiter((option.current_houses == 0 for option in options),
+                                     dtype=bool, count=count)
         
-        # Get landing probability for this property
-        landing_prob = self.landing_probs.get(property_pos, 1.0/40)
+        multipliers = np.ones(count)
         
-        # Expected value calculation
-        # Each opponent has landing_prob chance of landing each turn
-        expected_landings = landing_prob * remaining_turns * num_opponents
+        # Preference 1: Hotels are highly desirable (finish what you started)
+        multipliers[is_hotel] *= 1.3
         
-        # Expected additional rent from this development
-        ev = option.rent_increase * expected_landings
+        # Preference 2: Orange properties are the best (high traffic from Jail)
+        multipliers[is_orange] *= 1.2
         
-        return ev
-    
-    def _apply_strategic_preferences(self, options: List[DevelopmentOption], player: Player):
-        """
-        Apply strategic preferences to boost/penalize certain options
-        Modifies ev_per_dollar based on strategic factors
-        """
-        for option in options:
-            multiplier = 1.0
-            
-            # Preference 1: Hotels are highly desirable (finish what you started)
-            if option.is_hotel:
-                multiplier *= 1.3
-            
-            # Preference 2: Orange properties are the best (high traffic from Jail)
-            if option.color_group == 'Orange':
-                multiplier *= 1.2
-            
-            # Preference 3: Red and Yellow are also good
-            elif option.color_group in ['Red', 'Yellow']:
-                multiplier *= 1.1
-            
-            # Preference 4: Early development (first house) is valuable for monopoly rent doubling
-            if option.current_houses == 0:
-                multiplier *= 1.15  # Going from base to monopoly is big jump
-            
-            # Preference 5: Risk-based adjustments
-            if player.risk_tolerance > 0.7:  # Aggressive players
-                # Prefer high-rent properties even if expensive
-                if option.cost > 150:
-                    multiplier *= 1.1
-            elif player.risk_tolerance < 0.4:  # Conservative players
-                # Prefer cheaper developments
-                if option.cost < 100:
-                    multiplier *= 1.1
-            
-            # Apply multiplier
-            option.ev_per_dollar *= multiplier
+        # Preference 3: Red and Yellow are also good
+        multipliers[is_red_or_yellow] *= 1.1
+        
+        # Preference 4: Early development (first house) is valuable for monopoly rent doubling
+        multipliers[is_first_house] *= 1.15  # Going from base to monopoly is big jump
+        
+        # Preference 5: Risk-based adjustments
+        if player.risk_tolerance > 0.7:  # Aggressive players
+            # Prefer high-rent properties even if expensive
+            multipliers[costs > 150] *= 1.1
+        elif player.risk_tolerance < 0.4:  # Conservative players
+            # Prefer cheaper developments
+            multipliers[costs < 100] *= 1.1
+        
+        return multipliers
     
     def _greedy_selection(self, 
                          options: List[DevelopmentOption],
+                         ev_per_dollar: np.ndarray,
                          available_cash: float) -> List[DevelopmentOption]:
         """
         Greedy algorithm: Select developments with highest EV per dollar within budget
         """
-        # Sort by EV per dollar (descending)
-        sorted_options = sorted(options, key=lambda x: x.ev_per_dollar, reverse=True)
+        # Max-heap on EV per dollar, popped lazily so a budget that runs out after a
+        # few picks never pays for a full sort; the index breaks ties in generation order
+        ranking = list(zip((-ev_per_dollar).tolist(), range(len(options))))
+        heapq.heapify(ranking)
+        cheapest = min(option.cost for option in options)
         
         selected = []
         spent = 0.0
+        occupied = 0  # Bit p set once position p is in the selection
         
-        for option in sorted_options:
+        while ranking:
+            # Nothing left can fit in the remaining budget
+            if spent + cheapest > available_cash:
+                break
+            
+            option = options[heapq.heappop(ranking)[1]]
+            
             # Check if we can afford this
             if spent + option.cost > available_cash:
                 continue
             
             # Check for conflicts (can't build on same property twice)
-            conflict = False
+            option_mask = 0
             for pos in option.property_positions:
-                if any(pos in sel.property_positions for sel in selected):
-                    conflict = True
-                    break
+                option_mask |= 1 << pos
             
-            if conflict:
+            if occupied & option_mask:
                 continue
             
             # Add to selection
             selected.append(option)
             spent += option.cost
+            occupied |= option_mask
             
             # Safety: Don't overspend
             if spent >= available_cash * 0.95:  # Leave small buffer
@@ -312,32 +363,32 @@ def estimate_remaining_turns(game_state: GameState) -> int:
     # Base expectation: Games typically go 150-200 turns with development
     avg_game_length = 180
     
-    # Adjust based on game state
-    active_players = game_state.get_active_players()
+    # One pass over the players for the active count and the largest holding
+    active_count = 0
+    max_properties = 0
+    for p in game_state.players:
+        if not p.is_bankrupt:
+            active_count += 1
+            owned = len(p.owned_properties)
+            if owned > max_properties:
+                max_properties = owned
     
-    if len(active_players) <= 2:
+    # Adjust based on game state
+    if active_count <= 2:
         # Down to 2 players, game likely to end soon
         avg_game_length = min(avg_game_length, current_turn + 50)
     
     # If someone is dominating (owns many properties), they'll build houses
     # and win faster
-    max_properties = max((p.get_total_properties() for p in active_players), default=0)
     if max_properties > 20:
         avg_game_length = min(avg_game_length, current_turn + 40)
     elif max_properties > 15:
         avg_game_length = min(avg_game_length, current_turn + 60)
     
-    # Early game: Be optimistic about game length
-    if current_turn < 30:
-        remaining = avg_game_length - current_turn
-    else:
-        # Mid/late game: More conservative
-        remaining = max(20, avg_game_length - current_turn)
-    
-    # Always estimate at least some remaining turns for development to pay off
-    remaining = max(30, remaining)  # At least 30 turns for houses to be worthwhile
-    
-    return remaining
+    # Always estimate at least some remaining turns for development to pay off:
+    # at least 30 turns for houses to be worthwhile, which also covers the
+    # 20-turn floor used in mid/late game
+    return max(30, avg_game_length - current_turn)
 
 
 # Test the module
@@ -371,10 +422,6 @@ if __name__ == '__main__':
     game = create_game(board, player_configs)
     player = game.players[0]
     
-    # Initialize houses (player starts with no houses)
-    for pos in player.owned_properties:
-        player.houses[pos] = 0
-    
     print("Test Scenario:")
     print(f"  Player: {player.name}")
     print(f"  Cash: ${player.cash}")
@@ -4,54 +4,193 @@ Monopoly Property Investment Analyzer
 Main script to run complete Monte Carlo analysis
 """
 
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import pickle
 import sys
 import time
+import numpy as np
+import pandas as pd
 from properties import load_board
 from simulator import MonopolySimulator
+from mechanics_numba import NUMBA_AVAILABLE
 from analytics import analyze_property_investment, format_analysis_report
 from csv_exporter import MonopolyCSVExporter
 
 
+# Persistent cache for run_property_analysis's simulations (delete the directory to
+# invalidate). Keys hash the scenario arguments, the board's contents, the engine
+# (compiled or Python) and ANALYSIS_CACHE_VERSION, but not the engine's code: bump
+# the version whenever a change alters simulation results
+ANALYSIS_CACHE_DIR = os.path.join(".cache", "analysis")
+ANALYSIS_CACHE_VERSION = 1
+
+
+def disk_cache(cache_dir: str = ANALYSIS_CACHE_DIR, ignore: tuple = (),
+               key_funcs: dict = None, version=None):
+    """
+    Cache a function's return value on disk, keyed by a hash of its arguments
+
+    The wrapper's cached_call(*args, **kwargs) returns (result, whether it was
+    loaded from the cache); __wrapped__ is the uncached function.
+
+    Args:
+        cache_dir: Directory holding one pickle per distinct call
+        ignore: Argument names left out of the key (e.g. pre-loaded objects)
+        key_funcs: Argument name -> function of its value, hashed in its place
+            (e.g. a fingerprint of a pre-loaded object)
+        version: Hashed into every key; change it to retire older entries
+
+    Returns:
+        Decorator
+    """
+    key_funcs = key_funcs or {}
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def cached_call(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_args = {name: key_funcs[name](value) if name in key_funcs else value
+                        for name, value in bound.arguments.items()
+                        if name not in ignore}
+            digest = hashlib.blake2b(
+                json.dumps([version, key_args], sort_keys=True, default=repr).encode(),
+                digest_size=16
+            ).hexdigest()
+            path = os.path.join(cache_dir, f"{func.__name__}_{digest}.pkl")
+
+            if os.path.exists(path):
+                print(f"Loaded cached result from {path}")
+                with open(path, 'rb') as f:
+                    return pickle.load(f), True
+
+            result = func(*args, **kwargs)
+            if result is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                # Write then rename so concurrent runs never read a partial file
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(result, f)
+                os.replace(tmp_path, path)
+            return result, False
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached_call(*args, **kwargs)[0]
+
+        wrapper.cached_call = cached_call
+        return wrapper
+    return decorator
+
+
+def _board_fingerprint(board) -> str:
+    """Digest of every property's spreadsheet fields, for cache keys"""
+    return hashlib.blake2b(repr(board.properties).encode(), digest_size=16).hexdigest()
+
+
+def _zero_as_int(values: np.ndarray, unset: np.ndarray) -> np.ndarray:
+    """
+    values as an object column with int 0 where unset, so those cells are written
+    as "0" (as for a field never assigned) and the rest as their float
+    """
+    column = values.astype(object)
+    column[unset] = 0
+    return column
+
+
+def cash_flows_for_csv(individual_results) -> np.ndarray:
+    """
+    individual_results.padded_rent_by_turn() for the cash flow timeline, with
+    int 0 (written "0") in the turns before the property was bought
+    """
+    padded = individual_results.padded_rent_by_turn()
+    grid = padded.astype(object)
+    unbought = (np.arange(padded.shape[1]) < np.where(
+        individual_results.property_purchased, individual_results.purchase_turn,
+        padded.shape[1])[:, np.newaxis])
+    grid[unbought & ~np.isnan(padded)] = 0
+    return grid
+
+
 def convert_results_for_csv(sim_stats, individual_results):
     """
-    Convert SimulationResult objects to dictionary format for CSV export
+    Convert a SimulationBatch's columns to the CSV exporter's per-run fields
 
     Args:
         sim_stats: Aggregated statistics from simulator
-        individual_results: List of SimulationResult objects
+        individual_results: SimulationBatch of raw results
 
     Returns:
-        List of dictionaries with CSV-friendly field names
+        DataFrame with one row per simulation and CSV-friendly field names
+        (cash flows come from cash_flows_for_csv(individual_results))
     """
-    csv_data = []
-
-    for sim_result in individual_results:
-        # Calculate ROI
-        if sim_result.property_purchased and sim_result.purchase_price > 0:
-            roi = ((sim_result.total_rent_collected - sim_result.purchase_price)
-                   / sim_result.purchase_price * 100)
-        else:
-            roi = 0
-
-        csv_data.append({
-            'boughtProperty': sim_result.property_purchased,
-            'totalInvestment': sim_result.purchase_price,
-            'totalReturns': sim_result.total_rent_collected,
-            'netProfit': sim_result.total_rent_collected - sim_result.purchase_price,
-            'roi': roi,
-            'npv': 0,  # Will be calculated if needed
-            'irr': 0,  # Will be calculated if needed
-            'propertiesOwned': 1 if sim_result.property_purchased else 0,
-            'housesBuilt': 0,  # Not tracked in current SimulationResult
-            'hotelsBuilt': 0,  # Not tracked in current SimulationResult
-            'totalRentCollected': sim_result.total_rent_collected,
-            'yearsSimulated': sim_result.turns_played // 52,  # Rough estimate
-            'totalTurns': sim_result.turns_played,
-            'finalCash': sim_result.final_player_cash,
-            'cashFlowByTurn': list(sim_result.rent_by_turn.values()) if hasattr(sim_result, 'rent_by_turn') else []
-        })
+    purchased = individual_results.property_purchased
+    price = individual_results.purchase_price
+    rent = individual_results.total_rent_collected
+    turns = individual_results.turns_played
+    zeros = np.zeros(len(individual_results), dtype=np.int64)
+
+    # ROI only where the property was bought at a positive price
+    bought_at_price = purchased & (price > 0)
+    roi = np.divide(rent - price, price, out=np.zeros_like(rent), where=bought_at_price) * 100
+
+    return pd.DataFrame({
+        'boughtProperty': purchased,
+        'totalInvestment': _zero_as_int(price, ~purchased),
+        'totalReturns': _zero_as_int(rent, rent == 0),
+        'netProfit': _zero_as_int(rent - price, ~purchased),
+        'roi': _zero_as_int(roi, ~bought_at_price),
+        'npv': zeros,  # Will be calculated if needed
+        'irr': zeros,  # Will be calculated if needed
+        'propertiesOwned': purchased.astype(np.int64),
+        'housesBuilt': zeros,  # Not tracked in SimulationBatch
+        'hotelsBuilt': zeros,  # Not tracked in SimulationBatch
+        'totalRentCollected': _zero_as_int(rent, rent == 0),
+        'yearsSimulated': turns // 52,  # Rough estimate
+        'totalTurns': turns,
+        'finalCash': individual_results.final_player_cash,
+    })
+
+
+@disk_cache(ignore=('num_workers',), key_funcs={'board': _board_fingerprint},
+            version=(ANALYSIS_CACHE_VERSION, 'compiled' if NUMBA_AVAILABLE else 'python'))
+def _simulate_property(target_position: int, player_configs: list, num_simulations: int,
+                       max_turns: int, enable_house_building: bool,
+                       return_individual_results: bool, board, num_workers: int = None):
+    """
+    Run the Monte Carlo simulations behind run_property_analysis (disk cached)
 
-    return csv_data
+    Returns:
+        (sim_stats, elapsed seconds)
+    """
+    print(f"\nRunning {num_simulations} simulations (max {max_turns} turns each)...")
+    print("This may take a minute...\n")
+
+    simulator = MonopolySimulator(board)
+    start_time = time.time()
+
+    simulation_kwargs = {
+        'target_player_idx': 0,
+        'target_property_position': target_position,
+        'player_configs': player_configs,
+        'num_simulations': num_simulations,
+        'max_turns': max_turns,
+        'enable_house_building': enable_house_building,
+        'return_individual_results': return_individual_results,
+    }
+    if NUMBA_AVAILABLE:
+        # Compiled kernel, threaded across cores
+        sim_stats = simulator.run_monte_carlo_compiled(**simulation_kwargs, num_threads=num_workers)
+    else:
+        sim_stats = simulator.run_monte_carlo_parallel(**simulation_kwargs, num_workers=num_workers)
+
+    return sim_stats, time.time() - start_time
 
 
 def run_property_analysis(
@@ -63,11 +202,18 @@ def run_property_analysis(
         num_simulations: int = 1000,
         max_turns: int = 250,
         enable_house_building: bool = True,
-        export_csv: bool = True
+        export_csv: bool = True,
+        board=None,
+        num_workers: int = None,
+        use_cache: bool = True
 ):
     """
     Run complete analysis for a property purchase decision
 
+    The simulations are cached on disk (see ANALYSIS_CACHE_DIR), so an unchanged
+    scenario replays the same sample; the report and CSV export run on every
+    call, cached or not.
+
     Args:
         property_name: Name of property to analyze
         your_cash: Your current cash
@@ -78,6 +224,10 @@ def run_property_analysis(
         max_turns: Maximum turns per game
         enable_house_building: Whether to enable house building
         export_csv: Whether to export results to CSV files
+        board: Pre-loaded MonopolyBoard to reuse across analyses (loaded if None)
+        num_workers: Processes to split the simulations across, or with numba the
+            compiled kernel's threads (defaults to the CPU count)
+        use_cache: Reuse (and store) cached simulations; False always re-simulates
 
     Returns:
         Complete analysis dictionary (with csv_files if export_csv=True)
@@ -87,8 +237,9 @@ def run_property_analysis(
     print(f"{'=' * 70}\n")
 
     # Load board
-    print("Loading board data...")
-    board = load_board()
+    if board is None:
+        print("Loading board data...")
+        board = load_board()
 
     # Find property
     target_property = board.get_property_by_name(property_name)
@@ -127,40 +278,37 @@ def run_property_analysis(
             'risk_tolerance': opp.get('risk_tolerance', 0.5)
         })
 
-    # Initialize simulator
-    print(f"\nInitializing Monte Carlo simulator...")
-    simulator = MonopolySimulator(board)
-
     # Run simulations
-    print(f"Running {num_simulations} simulations (max {max_turns} turns each)...")
-    print("This may take a minute...\n")
-
-    start_time = time.time()
-
-    sim_stats = simulator.run_monte_carlo(
-        target_player_idx=0,
-        target_property_position=target_property.position,
-        player_configs=player_configs,
-        num_simulations=num_simulations,
-        max_turns=max_turns,
-        enable_house_building=enable_house_building,
-        return_individual_results=export_csv  # Get individual results for CSV export
-    )
-
-    elapsed = time.time() - start_time
-    print(f"\n✓ Completed in {elapsed:.2f} seconds")
-    print(f"  ({elapsed / num_simulations * 1000:.1f}ms per simulation)\n")
+    simulate_args = (target_property.position, player_configs, num_simulations, max_turns,
+                     enable_house_building,
+                     export_csv)  # Get individual results for CSV export
+    if use_cache:
+        (sim_stats, elapsed), from_cache = _simulate_property.cached_call(
+            *simulate_args, board=board, num_workers=num_workers)
+    else:
+        sim_stats, elapsed = _simulate_property.__wrapped__(
+            *simulate_args, board=board, num_workers=num_workers)
+        from_cache = False
+
+    if from_cache:
+        print(f"\n✓ Reusing {num_simulations} cached simulations from an earlier run")
+        print("  (pass use_cache=False for a fresh sample)\n")
+    else:
+        print(f"\n✓ Completed in {elapsed:.2f} seconds")
+        print(f"  ({elapsed / num_simulations * 1000:.1f}ms per simulation)\n")
 
     # Export to CSV if requested
     csv_files = None
     if export_csv and 'individual_results' in sim_stats:
         print("Exporting results to CSV...")
-        csv_data = convert_results_for_csv(sim_stats, sim_stats['individual_results'])
+        batch = sim_stats['individual_results']
+        csv_data = convert_results_for_csv(sim_stats, batch)
 
         exporter = MonopolyCSVExporter(output_dir="csv_exports")
         csv_files = exporter.export_all(
             simulation_results=csv_data,
-            property_name=property_name.replace(" ", "_")
+            property_name=property_name.replace(" ", "_"),
+            cash_flows=cash_flows_for_csv(batch)
         )
 
         # Remove individual_results from sim_stats to save memory
@@ -174,7 +322,8 @@ def run_property_analysis(
     analysis['simulation_metadata'] = {
         'num_simulations': num_simulations,
         'max_turns': max_turns,
-        'elapsed_time': elapsed,
+        'elapsed_time': elapsed,  # Of the original run when from_cache
+        'from_cache': from_cache,
         'property_position': target_property.position
     }
 
@@ -183,7 +332,7 @@ def run_property_analysis(
         analysis['csv_files'] = csv_files
 
     # Print report
-    print(format_analysis_report(target_property.name, analysis))
+    format_analysis_report(target_property.name, analysis, out=sys.stdout)
 
     return analysis
 
@@ -235,8 +384,8 @@ def main():
         print(f"\n📊 Simulations: {analysis['simulation_metadata']['num_simulations']}")
         print(f"📈 Expected NPV: ${analysis['npv_mean']:,.0f}")
         print(f"💵 Expected Total Rent: ${analysis['expected_total_rent']:,.0f}")
-        payback_str = f"{analysis['payback_mean_turns']:.1f} turns" if analysis[
-            'payback_mean_turns'] else "Never (insufficient rent)"
+        payback_str = "Never (insufficient rent)" if math.isnan(analysis['payback_mean_turns']) \
+            else f"{analysis['payback_mean_turns']:.1f} turns"
         print(f"⏱️  Average Payback: {payback_str}")
         print(f"💰 Recommendation: {analysis['recommendation']}")
 
@@ -1,18 +1,78 @@
 """
 Core game mechanics: dice rolling, movement, rent payments, transactions
 """
-import random
 from typing import Tuple, Optional, List
+from dataclasses import dataclass, field
+import numpy as np
 from game_state import GameState, Player
-from properties import Property
+from properties import Property, RENT_BASE, RENT_COLOR_SET, RENT_HOUSES
+
+# Landing outcomes (TurnRecord.action)
+ACTION_NONE = 0  # No landing this turn (bankrupt or in jail)
+ACTION_GO_TO_JAIL = 1
+ACTION_PAY_TAX = 2
+ACTION_FREE_SPACE = 3
+ACTION_AVAILABLE_FOR_PURCHASE = 4
+ACTION_OWN_PROPERTY = 5
+ACTION_PAY_RENT = 6
+
+# Event-dict names of the landing outcomes
+ACTION_NAMES = {
+    ACTION_NONE: None,
+    ACTION_GO_TO_JAIL: 'go_to_jail',
+    ACTION_PAY_TAX: 'pay_tax',
+    ACTION_FREE_SPACE: 'free_space',
+    ACTION_AVAILABLE_FOR_PURCHASE: 'available_for_purchase',
+    ACTION_OWN_PROPERTY: 'own_property',
+    ACTION_PAY_RENT: 'pay_rent',
+}
+
+
+@dataclass(slots=True)
+class TurnRecord:
+    """
+    Fixed-layout outcome of one turn, reused by GameMechanics every turn
+    
+    amount follows the landing event: the purchase price when available,
+    negative for rent and tax paid.
+    """
+    played: bool = False  # False if the player was bankrupt
+    in_jail: bool = False  # Turn spent in jail (no roll)
+    die1: int = 0
+    die2: int = 0
+    passed_go: bool = False
+    action: int = ACTION_NONE
+    position: int = 0  # Space landed on
+    amount: float = 0
+    owner: Optional[Player] = None  # Rent recipient
+    purchase_attempted: bool = False
+    purchased: bool = False
+    builds: list = field(default_factory=list)  # DevelopmentOptions built this turn
+
 
 class GameMechanics:
     """Handles all game mechanics and rules"""
     
-    def __init__(self, game_state: GameState, enable_house_building: bool = False):
+    def __init__(self, game_state: GameState, enable_house_building: bool = False,
+                 dice: Optional[np.ndarray] = None,
+                 rng: Optional[np.random.Generator] = None):
+        """
+        Args:
+            dice: Pre-rolled dice, dice[t] = (die1, die2) for total turn t;
+                rolled from rng per turn if None
+            rng: Generator for unrolled dice (a fresh PCG64 stream if None)
+        """
         self.game = game_state
         self.board = game_state.board
         self.enable_house_building = enable_house_building
+        self.dice = dice
+        if rng is None and dice is None:
+            rng = np.random.default_rng()
+        self.rng = rng
+        self.turn_record = TurnRecord()
+        # Plain-list views of the board's columnar tables: scalar reads return Python values
+        (self._rent_table, self._railroad_rent, self._utility_rent,
+         self._is_railroad, self._is_utility, self._color_idx) = self.board.table_lists
         
         # Initialize house building engine if enabled
         if self.enable_house_building:
@@ -27,8 +87,10 @@ class GameMechanics:
         Roll two dice
         Returns: (die1, die2, is_doubles)
         """
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
+        if self.dice is not None:
+            die1, die2 = self.dice[self.game.total_turns].tolist()
+        else:
+            die1, die2 = self.rng.integers(1, 7, size=2).tolist()
         is_doubles = (die1 == die2)
         return die1, die2, is_doubles
     
@@ -47,23 +109,24 @@ class GameMechanics:
         Handle a player landing on a space
         Returns dict with action details for tracking
         """
+        record = self.turn_record
+        self._land(player, record)
+        return self._landing_event(record)
+    
+    def _land(self, player: Player, record: 'TurnRecord'):
+        """Apply the landing at player.position, noting the outcome in record"""
         position = player.position
         prop = self.board.get_property(position)
-        
-        result = {
-            'position': position,
-            'property_name': prop.name,
-            'action': None,
-            'amount': 0,
-            'owner': None
-        }
+        record.position = position
+        record.amount = 0
+        record.owner = None
         
         # Special spaces
         if prop.name == 'Go To Jail':
             player.position = 10  # Jail position
             player.in_jail = True
-            result['action'] = 'go_to_jail'
-            return result
+            record.action = ACTION_GO_TO_JAIL
+            return
         
         if prop.name in ['Income Tax', 'Luxury Tax']:
             # Income Tax = -200, Luxury Tax = -100 (from Excel)
@@ -72,71 +135,72 @@ class GameMechanics:
             else:
                 amount = 100
             player.pay(amount)
-            result['action'] = 'pay_tax'
-            result['amount'] = -amount
-            return result
+            record.action = ACTION_PAY_TAX
+            record.amount = -amount
+            return
         
         # Property spaces
         if not prop.is_purchasable():
-            result['action'] = 'free_space'
-            return result
+            record.action = ACTION_FREE_SPACE
+            return
         
         owner = self.game.get_property_owner(position)
         
         if owner is None:
             # Property available for purchase
-            result['action'] = 'available_for_purchase'
-            result['amount'] = prop.purchase_price
-            return result
+            record.action = ACTION_AVAILABLE_FOR_PURCHASE
+            record.amount = prop.purchase_price
+            return
         
-        if owner == player:
+        if owner is player:
             # Own property, nothing happens
-            result['action'] = 'own_property'
-            return result
+            record.action = ACTION_OWN_PROPERTY
+            return
         
         # Must pay rent to owner
         rent = self.calculate_rent(position, owner)
         player.pay(rent)
         owner.receive(rent)
         
-        result['action'] = 'pay_rent'
-        result['amount'] = -rent
-        result['owner'] = owner.name
-        
-        return result
+        record.action = ACTION_PAY_RENT
+        record.amount = -rent
+        record.owner = owner
+    
+    def _landing_event(self, record: 'TurnRecord') -> dict:
+        """The landing as handle_landing's result dict"""
+        return {
+            'position': record.position,
+            'property_name': self.board.get_property(record.position).name,
+            'action': ACTION_NAMES[record.action],
+            'amount': record.amount,
+            'owner': record.owner.name if record.owner is not None else None
+        }
     
     def calculate_rent(self, position: int, owner: Player) -> float:
         """Calculate rent for a property"""
-        prop = self.board.get_property(position)
-        
-        # Get number of houses
-        houses = owner.houses.get(position, 0)
-        
-        # Check for monopoly
-        has_monopoly = False
-        if prop.color and prop.property_type == 'Street':
-            has_monopoly = self.game.player_has_monopoly(owner, prop.color)
-        
         # Special case: Railroads
-        if prop.property_type == 'Railroad':
-            # Count owned railroads
-            railroad_positions = [5, 15, 25, 35]
-            owned_railroads = sum(1 for pos in railroad_positions if owner.owns_property(pos))
+        if self._is_railroad[position]:
+            # Count owned railroads: popcount of the owner's railroad bits
+            owned_railroads = (owner.owned_mask & self.board.railroad_mask).bit_count()
             # Rent: 25, 50, 100, 200 for 1,2,3,4 railroads
-            rent_multiplier = 2 ** (owned_railroads - 1)
-            return 25 * rent_multiplier
+            return self._railroad_rent[owned_railroads - 1]
         
         # Special case: Utilities
-        if prop.property_type == 'Utility':
-            # For simplicity, use fixed multiplier (in real game, it's dice roll x 4 or x 10)
-            utility_positions = [12, 28]
-            owned_utilities = sum(1 for pos in utility_positions if owner.owns_property(pos))
-            multiplier = 10 if owned_utilities == 2 else 4
-            # Use average dice roll of 7
-            return 7 * multiplier
-        
-        # Regular property rent
-        return prop.get_rent(has_monopoly, houses)
+        if self._is_utility[position]:
+            # For simplicity, use the average roll (in real game, it's dice roll x 4 or x 10)
+            owned_utilities = (owner.owned_mask & self.board.utility_mask).bit_count()
+            return self._utility_rent[owned_utilities - 1]
+        
+        # Regular property rent: the column for the development level
+        houses = owner.houses[position]
+        color = self._color_idx[position]
+        if houses:
+            column = RENT_HOUSES + houses
+        elif color >= 0 and self.game.player_has_monopoly(owner, self.board.colors[color]):
+            column = RENT_COLOR_SET
+        else:
+            column = RENT_BASE
+        return self._rent_table[position][column]
     
     def purchase_property(self, player: Player, position: int) -> bool:
         """
@@ -155,17 +219,26 @@ class GameMechanics:
         if prop.purchase_price is None:
             return False
         
-        return player.buy_property(position, prop.purchase_price)
+        return self.game.buy_property(player, position, prop.purchase_price)
     
-    def take_turn(self, player: Player, strategy_func=None) -> List[dict]:
+    def play_turn(self, player: Player, strategy_func=None) -> 'TurnRecord':
         """
-        Execute one player's turn
-        Returns list of events that occurred
+        Execute one player's turn without building event dicts
+        
+        Returns this engine's TurnRecord, overwritten by the next turn.
         """
-        events = []
+        record = self.turn_record
+        record.played = False
+        record.in_jail = False
+        record.passed_go = False
+        record.action = ACTION_NONE
+        record.purchase_attempted = False
+        record.purchased = False
+        record.builds.clear()
         
         if player.is_bankrupt:
-            return events
+            return record
+        record.played = True
         
         # Handle jail (simplified - just skip turn)
         if player.in_jail:
@@ -173,47 +246,24 @@ class GameMechanics:
             if player.jail_turns >= 3:
                 player.in_jail = False
                 player.jail_turns = 0
-            events.append({'event': 'in_jail', 'player': player.name})
-            return events
+            record.in_jail = True
+            return record
         
         # Roll dice
-        die1, die2, is_doubles = self.roll_dice()
-        total = die1 + die2
-        
-        events.append({
-            'event': 'roll',
-            'player': player.name,
-            'roll': total,
-            'is_doubles': is_doubles
-        })
+        record.die1, record.die2, _ = self.roll_dice()
         
         # Move
-        passed_go = self.move_player(player, total)
-        if passed_go:
-            events.append({
-                'event': 'passed_go',
-                'player': player.name,
-                'amount': 200
-            })
+        record.passed_go = self.move_player(player, record.die1 + record.die2)
         
         # Handle landing
-        landing_result = self.handle_landing(player)
-        landing_result['player'] = player.name
-        landing_result['event'] = 'landing'
-        events.append(landing_result)
+        self._land(player, record)
         
         # Purchase decision (if property available and strategy provided)
-        if landing_result['action'] == 'available_for_purchase' and strategy_func:
+        if record.action == ACTION_AVAILABLE_FOR_PURCHASE and strategy_func:
             should_buy = strategy_func(self.game, player, player.position)
             if should_buy:
-                success = self.purchase_property(player, player.position)
-                events.append({
-                    'event': 'purchase',
-                    'player': player.name,
-                    'position': player.position,
-                    'success': success,
-                    'amount': -landing_result['amount'] if success else 0
-                })
+                record.purchase_attempted = True
+                record.purchased = self.purchase_property(player, player.position)
         
         # House building phase (if enabled)
         if self.enable_house_building and self.house_builder:
@@ -231,18 +281,66 @@ class GameMechanics:
                     player.pay(option.cost)
                     
                     # Add house/hotel
-                    current = player.houses.get(pos, 0)
                     player.houses[pos] = option.new_houses
-                    
-                    events.append({
-                        'event': 'build_house',
-                        'player': player.name,
-                        'position': pos,
-                        'property': option.property_name,
-                        'houses': option.new_houses,
-                        'cost': -option.cost,
-                        'is_hotel': option.is_hotel
-                    })
+            record.builds.extend(development_options)
+        
+        return record
+    
+    def take_turn(self, player: Player, strategy_func=None) -> List[dict]:
+        """
+        Execute one player's turn
+        Returns list of events that occurred
+        """
+        record = self.play_turn(player, strategy_func)
+        events = []
+        
+        if not record.played:
+            return events
+        
+        if record.in_jail:
+            events.append({'event': 'in_jail', 'player': player.name})
+            return events
+        
+        total = record.die1 + record.die2
+        events.append({
+            'event': 'roll',
+            'player': player.name,
+            'roll': total,
+            'is_doubles': record.die1 == record.die2
+        })
+        
+        if record.passed_go:
+            events.append({
+                'event': 'passed_go',
+                'player': player.name,
+                'amount': 200
+            })
+        
+        landing_result = self._landing_event(record)
+        landing_result['player'] = player.name
+        landing_result['event'] = 'landing'
+        events.append(landing_result)
+        
+        if record.purchase_attempted:
+            events.append({
+                'event': 'purchase',
+                'player': player.name,
+                'position': player.position,
+                'success': record.purchased,
+                'amount': -record.amount if record.purchased else 0
+            })
+        
+        for option in record.builds:
+            for pos in option.property_positions:
+                events.append({
+                    'event': 'build_house',
+                    'player': player.name,
+                    'position': pos,
+                    'property': option.property_name,
+                    'houses': option.new_houses,
+                    'cost': -option.cost,
+                    'is_hotel': option.is_hotel
+                })
         
         return events
 
@@ -289,7 +387,7 @@ if __name__ == '__main__':
     print(f"Rent for {prop.name} (no monopoly): ${rent}")
     
     # Give owner monopoly
-    owner.owned_properties.append(3)  # Baltic Avenue
+    game.give_property(owner, 3)  # Baltic Avenue
     rent_monopoly = mechanics.calculate_rent(1, owner)
     print(f"Rent for {prop.name} (with monopoly): ${rent_monopoly}")
     
@@ -0,0 +1,582 @@
+"""
+Compiled game kernel: whole Monte Carlo batches played on flat NumPy arrays
+
+Mirrors the rules of mechanics.GameMechanics, the buying strategies and the
+house building engine turn for turn, with players held as columns of typed
+arrays instead of Player objects, so numba can compile the game loop and run
+simulations across cores. Used by MonopolySimulator.run_monte_carlo_compiled
+when numba is installed.
+"""
+import contextlib
+import functools
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from properties import MonopolyBoard, RENT_BASE, RENT_COLOR_SET, RENT_HOUSES
+from game_state import BOARD_SIZE
+from house_building import LANDING_PROBS, MAX_DEVELOPMENT
+
+try:
+    from numba import config, get_num_threads, njit, prange, parallel_chunksize, set_num_threads
+except ImportError:  # numba is an optional accelerator
+    njit = None
+    prange = range
+
+    def parallel_chunksize(chunksize):
+        """No threads to schedule without numba"""
+        return contextlib.nullcontext()
+
+NUMBA_AVAILABLE = njit is not None
+
+# Space kinds
+SPACE_FREE = 0
+SPACE_STREET = 1
+SPACE_RAILROAD = 2
+SPACE_UTILITY = 3
+SPACE_GO_TO_JAIL = 4
+SPACE_TAX = 5
+
+JAIL_POSITION = 10
+GO_SALARY = 200.0
+
+# Movement by lookup: NEXT_POSITION[pos, roll] and whether that move passes GO
+_MOVE_SUMS = np.add.outer(np.arange(BOARD_SIZE), np.arange(13))
+NEXT_POSITION = (_MOVE_SUMS % BOARD_SIZE).astype(np.int8)
+PASSES_GO = _MOVE_SUMS >= BOARD_SIZE
+
+# Ownership is a uint64 bitmask per player, bit p set when position p is owned
+# (as Player.owned_mask)
+_ONE = np.uint64(1)
+
+# Player flag bits in the kernel's per-game state
+FLAG_IN_JAIL = np.uint8(1)
+FLAG_BANKRUPT = np.uint8(2)
+
+# Games per prange work item: game lengths vary (bankruptcies end games early),
+# so threads take small chunks as they free up rather than one fixed slice each
+PRANGE_CHUNKSIZE = 16
+
+# Buying strategies, as chosen by strategies.get_strategy
+STRATEGY_CONSERVATIVE = 0
+STRATEGY_BALANCED = 1
+STRATEGY_AGGRESSIVE = 2
+
+
+def _kernel(func):
+    """Compile a kernel helper when numba is installed (plain Python otherwise)"""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+@functools.lru_cache(maxsize=8)
+def pack_board(board: MonopolyBoard) -> Tuple[np.ndarray, ...]:
+    """
+    Per-position and per-color-group arrays the kernel reads the board from
+
+    Cached per board. Returns (kind, tax, price, rent_table, railroad_rent,
+    utility_rent, railroad_mask, utility_mask, house_cost, group_of,
+    group_members, group_size, group_mask, group_boost, group_good,
+    landing_probs); the masks hold ownership bits, as board.railroad_mask and
+    board.utility_mask, and group_mask those of each color group.
+    """
+    num_positions = len(board.properties)
+    kind = np.full(num_positions, SPACE_FREE, dtype=np.int8)
+    tax = np.zeros(num_positions)
+
+    for prop in board.properties:
+        pos = prop.position
+        if prop.name == 'Go To Jail':
+            kind[pos] = SPACE_GO_TO_JAIL
+        elif prop.name in ('Income Tax', 'Luxury Tax'):
+            kind[pos] = SPACE_TAX
+            tax[pos] = 200.0 if prop.name == 'Income Tax' else 100.0
+        elif prop.property_type == 'Street':
+            kind[pos] = SPACE_STREET
+        elif prop.property_type == 'Railroad':
+            kind[pos] = SPACE_RAILROAD
+        elif prop.property_type == 'Utility':
+            kind[pos] = SPACE_UTILITY
+
+    # Color groups in board.colors order, members padded with -1
+    colors = board.colors
+    group_members = np.full((len(colors), max(map(len, board.color_groups.values()))), -1,
+                            dtype=np.int64)
+    group_size = np.zeros(len(colors), dtype=np.int64)
+    group_mask = np.array([board.color_masks[color] for color in colors], dtype=np.uint64)
+    group_boost = np.ones(len(colors))
+    group_good = np.zeros(len(colors), dtype=bool)
+    for g, color in enumerate(colors):
+        positions = board.color_groups[color]
+        group_members[g, :len(positions)] = positions
+        group_size[g] = len(positions)
+        # House building preferences and the balanced strategy's good colors
+        if color == 'Orange':
+            group_boost[g] = 1.2
+        elif color in ('Red', 'Yellow'):
+            group_boost[g] = 1.1
+        group_good[g] = color in ('Orange', 'Red', 'Yellow', 'Green')
+
+    return (kind, tax, board.purchase_price, board.rent_table, board.railroad_rent,
+            board.utility_rent, np.uint64(board.railroad_mask), np.uint64(board.utility_mask),
+            board.house_cost, board.color_idx.astype(np.int64), group_members, group_size,
+            group_mask, group_boost, group_good, np.asarray(LANDING_PROBS))
+
+
+def pack_players(player_configs: List[Dict]) -> Tuple[np.ndarray, ...]:
+    """
+    Starting player state as arrays, with create_game's defaults
+
+    Returns (cash, position, owned, owner, strategy, risk, reserve); owned
+    holds each player's ownership bitmask, owner the first listed owner of
+    each position, or -1.
+    """
+    num_players = len(player_configs)
+    cash = np.zeros(num_players)
+    position = np.zeros(num_players, dtype=np.int64)
+    owned = np.zeros(num_players, dtype=np.uint64)
+    owner = np.full(BOARD_SIZE, -1, dtype=np.int64)
+    strategy = np.zeros(num_players, dtype=np.int64)
+    risk = np.zeros(num_players)
+    reserve = np.zeros(num_players)
+
+    for p, config in enumerate(player_configs):
+        cash[p] = config.get('cash', 1500)
+        position[p] = config.get('position', 0)
+        for pos in config.get('owned_properties', []):
+            owned[p] |= np.uint64(1 << pos)
+            if owner[pos] < 0:
+                owner[pos] = p
+        risk[p] = config.get('risk_tolerance', 0.5)
+        reserve[p] = config.get('min_cash_reserve', 200)
+        if risk[p] < 0.4:
+            strategy[p] = STRATEGY_CONSERVATIVE
+        elif risk[p] < 0.6:
+            strategy[p] = STRATEGY_BALANCED
+        else:
+            strategy[p] = STRATEGY_AGGRESSIVE
+
+    return cash, position, owned, owner, strategy, risk, reserve
+
+
+@_kernel
+def _popcount(x):
+    """Set bits in a uint64, by SWAR (parallel bit counts within the word)"""
+    x = x - ((x >> _ONE) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = x + (x >> np.uint64(8))
+    x = x + (x >> np.uint64(16))
+    x = x + (x >> np.uint64(32))
+    return np.int64(x & np.uint64(0x7F))
+
+
+@_kernel
+def _owns_group(owned_bits, group_mask, g):
+    """Whether an ownership bitmask covers all of color group g"""
+    return (owned_bits & group_mask[g]) == group_mask[g]
+
+
+@_kernel
+def _rent(pos, o, kind, rent_table, railroad_rent, utility_rent, railroad_mask, utility_mask,
+          group_of, group_mask, owned, houses):
+    """GameMechanics.calculate_rent for owner o"""
+    if kind[pos] == SPACE_RAILROAD:
+        return railroad_rent[_popcount(owned[o] & railroad_mask) - 1]
+
+    if kind[pos] == SPACE_UTILITY:
+        return utility_rent[_popcount(owned[o] & utility_mask) - 1]
+
+    h = houses[o, pos]
+    if h:
+        return rent_table[pos, RENT_HOUSES + h]
+    g = group_of[pos]
+    if g >= 0 and _owns_group(owned[o], group_mask, g):
+        return rent_table[pos, RENT_COLOR_SET]
+    return rent_table[pos, RENT_BASE]
+
+
+@_kernel
+def _should_buy(p, pos, strategy, cash, owned, kind, price, rent_table, utility_mask,
+                group_of, group_size, group_mask, group_good):
+    """The buying strategy of player p (see strategies.py) for position pos"""
+    cost = price[pos]
+    if np.isnan(cost):
+        return False
+    g = group_of[pos]
+
+    if strategy[p] == STRATEGY_CONSERVATIVE:
+        if cash[p] < cost * 3:
+            return False
+        if g >= 0 and _popcount(owned[p] & group_mask[g]) == group_size[g] - 1:
+            return True
+        return cost <= 150
+
+    if strategy[p] == STRATEGY_AGGRESSIVE:
+        if cash[p] < cost + 100:
+            return False
+        if kind[pos] == SPACE_UTILITY:
+            return _popcount(owned[p]) < 3
+        if cost < 100:
+            return _popcount(owned[p]) < 5
+        return True
+
+    # Balanced
+    if cash[p] < cost * 2 + 250:
+        return False
+    if g >= 0:
+        owned_in_group = _popcount(owned[p] & group_mask[g])
+        if owned_in_group == group_size[g] - 1:
+            return True
+        if owned_in_group == 0 and group_good[g]:
+            return True
+    if kind[pos] == SPACE_RAILROAD:
+        return True
+    if kind[pos] == SPACE_UTILITY:
+        return _popcount(owned[p] & utility_mask) == 1
+    hotel_rent = rent_table[pos, RENT_HOUSES + MAX_DEVELOPMENT]
+    if cost and hotel_rent:
+        return hotel_rent / cost > 3.5
+    return False
+
+
+@_kernel
+def _estimate_remaining_turns(turn, flags, owned):
+    """house_building.estimate_remaining_turns at total turn count turn"""
+    avg_game_length = 180
+    active_count = 0
+    max_properties = 0
+    for q in range(flags.shape[0]):
+        if not flags[q] & FLAG_BANKRUPT:
+            active_count += 1
+            count = _popcount(owned[q])
+            if count > max_properties:
+                max_properties = count
+    if active_count <= 2:
+        avg_game_length = min(avg_game_length, turn + 50)
+    if max_properties > 20:
+        avg_game_length = min(avg_game_length, turn + 40)
+    elif max_properties > 15:
+        avg_game_length = min(avg_game_length, turn + 60)
+    return max(30, avg_game_length - turn)
+
+
+@_kernel
+def _build_houses(p, turn, cash, flags, owned, houses, risk, reserve, rent_table,
+                  house_cost, group_members, group_size, group_mask, group_boost,
+                  landing_probs, opt_pos, opt_level, opt_cost, opt_value):
+    """
+    One HouseBuildingEngine.decide_development pass for player p, applied
+
+    opt_* are the game's BOARD_SIZE-long scratch buffers for the options
+    (at most one per position), reused every turn.
+    """
+    num_groups = group_size.shape[0]
+    available_cash = cash[p] - reserve[p]
+
+    has_monopoly = False
+    for g in range(num_groups):
+        if _owns_group(owned[p], group_mask, g):
+            has_monopoly = True
+            break
+    if not has_monopoly or available_cash < 50:
+        return
+
+    # Options in generation order: monopolies in board order, then group order
+    count = 0
+    remaining = _estimate_remaining_turns(turn, flags, owned)
+    num_opponents = 0
+    for q in range(flags.shape[0]):
+        if not flags[q] & FLAG_BANKRUPT and q != p:
+            num_opponents += 1
+    opponent_turns = remaining * num_opponents
+
+    for g in range(num_groups):
+        if not _owns_group(owned[p], group_mask, g):
+            continue
+        min_houses = MAX_DEVELOPMENT
+        for k in range(group_size[g]):
+            min_houses = min(min_houses, houses[p, group_members[g, k]])
+        if min_houses >= MAX_DEVELOPMENT:
+            continue
+        for k in range(group_size[g]):
+            pos = group_members[g, k]
+            if houses[p, pos] != min_houses:
+                continue
+            # Monopoly rent: color-set rent unimproved, then the house columns
+            old_rent = rent_table[pos, RENT_COLOR_SET + min_houses]
+            new_rent = rent_table[pos, RENT_COLOR_SET + min_houses + 1]
+            if new_rent <= old_rent:
+                continue
+            cost = house_cost[pos]
+            expected_value = (new_rent - old_rent) * (landing_probs[pos] * opponent_turns)
+            ev_per_dollar = expected_value / cost if cost > 0 else 0.0
+            multiplier = 1.0
+            if min_houses >= 4:
+                multiplier *= 1.3
+            multiplier *= group_boost[g]
+            if min_houses == 0:
+                multiplier *= 1.15
+            if risk[p] > 0.7:
+                if cost > 150:
+                    multiplier *= 1.1
+            elif risk[p] < 0.4:
+                if cost < 100:
+                    multiplier *= 1.1
+            opt_pos[count] = pos
+            opt_level[count] = min_houses + 1
+            opt_cost[count] = cost
+            opt_value[count] = ev_per_dollar * multiplier
+            count += 1
+
+    if count == 0:
+        return
+
+    # Greedy selection by EV per dollar, ties in generation order: a few options
+    # at most, so scan for the best remaining one instead of sorting (no allocation)
+    cheapest = opt_cost[:count].min()
+    spent = 0.0
+    for _ in range(count):
+        if spent + cheapest > available_cash:
+            break
+        idx = 0
+        for j in range(1, count):
+            if opt_value[j] > opt_value[idx]:
+                idx = j
+        opt_value[idx] = -np.inf  # Taken
+        if spent + opt_cost[idx] > available_cash:
+            continue
+        spent += opt_cost[idx]
+        # Pay as Player.pay does (the selection is fixed before any payment)
+        cash[p] -= opt_cost[idx]
+        if cash[p] < 0:
+            flags[p] |= FLAG_BANKRUPT
+        houses[p, opt_pos[idx]] = opt_level[idx]
+        if spent >= available_cash * 0.95:
+            break
+
+
+@_kernel
+def _play_game(i, dice, target_player, target_pos, enable_house_building,
+               kind, tax, price, rent_table, railroad_rent, utility_rent,
+               railroad_mask, utility_mask, house_cost, group_of,
+               group_members, group_size, group_mask, group_boost, group_good, landing_probs,
+               cash0, position0, owned0, owner0, strategy, risk, reserve,
+               cash, position, owned, owner, jail_turns, flags, houses,
+               opt_pos, opt_level, opt_cost, opt_value,
+               turns_played, property_purchased, purchase_turn, purchase_price,
+               total_rent_collected, total_rent_paid, rent_by_turn, break_even_turn,
+               final_player_cash, player_won, player_bankrupt):
+    """
+    Play game i of a batch (run_single_simulation) and write its row of results
+
+    dice[t] holds the two dice for turn t, used only if the player rolls.
+    cash through houses are the game's state rows, reset here from the
+    starting arrays; flags packs FLAG_IN_JAIL and FLAG_BANKRUPT per player.
+    opt_* are the house building scratch rows, BOARD_SIZE long.
+    """
+    num_players = cash0.shape[0]
+    max_turns = dice.shape[0]
+    cash[:] = cash0
+    position[:] = position0
+    owned[:] = owned0
+    owner[:] = owner0
+    jail_turns[:] = 0
+    flags[:] = 0
+    houses[:] = 0
+
+    was_purchased = False
+    bought_turn = -1
+    bought_price = 0.0
+    rent_collected = 0.0
+    rent_paid = 0.0
+    cumulative_rent = 0.0
+    paid_back_turn = -1
+
+    turn = 0
+    p = 0
+    while turn < max_turns:
+        active = 0
+        for q in range(num_players):
+            if not flags[q] & FLAG_BANKRUPT:
+                active += 1
+        if active <= 1:
+            break
+
+        if not flags[p] & FLAG_BANKRUPT:
+            if flags[p] & FLAG_IN_JAIL:
+                jail_turns[p] += 1
+                if jail_turns[p] >= 3:
+                    flags[p] &= ~FLAG_IN_JAIL
+                    jail_turns[p] = 0
+            else:
+                roll = dice[turn, 0] + dice[turn, 1]
+                if PASSES_GO[position[p], roll]:
+                    cash[p] += GO_SALARY
+                pos = np.int64(NEXT_POSITION[position[p], roll])
+                position[p] = pos
+
+                space = kind[pos]
+                if space == SPACE_GO_TO_JAIL:
+                    position[p] = JAIL_POSITION
+                    flags[p] |= FLAG_IN_JAIL
+                elif space == SPACE_TAX:
+                    cash[p] -= tax[pos]
+                    if cash[p] < 0:
+                        flags[p] |= FLAG_BANKRUPT
+                elif space != SPACE_FREE:
+                    o = owner[pos]
+                    if o < 0:
+                        buy = (p == target_player and pos == target_pos) or _should_buy(
+                            p, pos, strategy, cash, owned, kind, price, rent_table,
+                            utility_mask, group_of, group_size, group_mask, group_good)
+                        if buy and not cash[p] - price[pos] < reserve[p]:
+                            cash[p] -= price[pos]
+                            owned[p] |= _ONE << np.uint64(pos)
+                            owner[pos] = p
+                            if pos == target_pos:
+                                was_purchased = True
+                                bought_turn = turn
+                                bought_price = price[pos]
+                                if bought_price <= 0:
+                                    paid_back_turn = turn + 1
+                    elif o != p:
+                        rent = _rent(pos, o, kind, rent_table, railroad_rent, utility_rent,
+                                     railroad_mask, utility_mask, group_of, group_mask,
+                                     owned, houses)
+                        cash[p] -= rent
+                        if cash[p] < 0:
+                            flags[p] |= FLAG_BANKRUPT
+                        cash[o] += rent
+                        if pos == target_pos:
+                            if p == target_player:
+                                rent_paid += rent
+                            elif o == target_player:
+                                rent_collected += rent
+                                cumulative_rent += rent
+                                # Net rent only rises here: break-even is the first
+                                # collection that covers the price
+                                if (was_purchased and paid_back_turn < 0
+                                        and cumulative_rent - bought_price >= 0):
+                                    paid_back_turn = turn
+
+                if enable_house_building:
+                    _build_houses(p, turn, cash, flags, owned, houses, risk, reserve,
+                                  rent_table, house_cost, group_members, group_size,
+                                  group_mask, group_boost, landing_probs,
+                                  opt_pos, opt_level, opt_cost, opt_value)
+
+        rent_by_turn[i, turn] = cumulative_rent - bought_price if was_purchased else 0.0
+        p += 1
+        if p == num_players:
+            p = 0
+        turn += 1
+
+    turns_played[i] = turn
+    property_purchased[i] = was_purchased
+    purchase_turn[i] = bought_turn
+    purchase_price[i] = bought_price
+    total_rent_collected[i] = rent_collected
+    total_rent_paid[i] = rent_paid
+    if was_purchased and 0 <= paid_back_turn < turn:
+        break_even_turn[i] = paid_back_turn
+    final_player_cash[i] = cash[target_player]
+    survivors = 0
+    for q in range(num_players):
+        if not flags[q] & FLAG_BANKRUPT:
+            survivors += 1
+    player_bankrupt[i] = (flags[target_player] & FLAG_BANKRUPT) != 0
+    player_won[i] = survivors == 1 and not player_bankrupt[i]
+
+
+def _run_sims(dice, target_player, target_pos, enable_house_building,
+              kind, tax, price, rent_table, railroad_rent, utility_rent,
+              railroad_mask, utility_mask, house_cost, group_of,
+              group_members, group_size, group_mask, group_boost, group_good, landing_probs,
+              cash0, position0, owned0, owner0, strategy, risk, reserve,
+              turns_played, property_purchased, purchase_turn, purchase_price,
+              total_rent_collected, total_rent_paid, rent_by_turn, break_even_turn,
+              final_player_cash, player_won, player_bankrupt):
+    """
+    Play len(dice) games across cores, game i rolling dice[i]
+
+    Game state lives in one row per game of batch-wide arrays (struct of
+    arrays, compact dtypes), allocated once rather than per game.
+    """
+    num_sims = dice.shape[0]
+    num_players = cash0.shape[0]
+    cash = np.empty((num_sims, num_players))
+    position = np.empty((num_sims, num_players), dtype=np.int8)
+    owned = np.empty((num_sims, num_players), dtype=np.uint64)
+    owner = np.empty((num_sims, BOARD_SIZE), dtype=np.int64)
+    jail_turns = np.empty((num_sims, num_players), dtype=np.int8)
+    flags = np.empty((num_sims, num_players), dtype=np.uint8)
+    houses = np.empty((num_sims, num_players, BOARD_SIZE), dtype=np.int8)
+    opt_pos = np.empty((num_sims, BOARD_SIZE), dtype=np.int64)
+    opt_level = np.empty((num_sims, BOARD_SIZE), dtype=np.int64)
+    opt_cost = np.empty((num_sims, BOARD_SIZE))
+    opt_value = np.empty((num_sims, BOARD_SIZE))
+    for i in prange(num_sims):
+        _play_game(i, dice[i], target_player, target_pos, enable_house_building,
+                   kind, tax, price, rent_table, railroad_rent, utility_rent,
+                   railroad_mask, utility_mask, house_cost, group_of,
+                   group_members, group_size, group_mask, group_boost, group_good, landing_probs,
+                   cash0, position0, owned0, owner0, strategy, risk, reserve,
+                   cash[i], position[i], owned[i], owner[i], jail_turns[i], flags[i], houses[i],
+                   opt_pos[i], opt_level[i], opt_cost[i], opt_value[i],
+                   turns_played, property_purchased, purchase_turn, purchase_price,
+                   total_rent_collected, total_rent_paid, rent_by_turn, break_even_turn,
+                   final_player_cash, player_won, player_bankrupt)
+
+
+run_sims = njit(parallel=True, cache=True)(_run_sims) if njit is not None else _run_sims
+
+
+@contextlib.contextmanager
+def _thread_limit(num_threads: Optional[int]):
+    """Run the enclosed kernel calls on at most num_threads threads (all if None)"""
+    if num_threads is None or not NUMBA_AVAILABLE:
+        yield
+        return
+    previous = get_num_threads()
+    set_num_threads(max(1, min(num_threads, config.NUMBA_NUM_THREADS)))
+    try:
+        yield
+    finally:
+        set_num_threads(previous)
+
+
+def play_batch(batch, board: MonopolyBoard, dice: np.ndarray, target_player_idx: int,
+               target_property_position: int, player_configs: List[Dict],
+               enable_house_building: bool, num_threads: Optional[int] = None):
+    """
+    Fill a SimulationBatch with compiled games, game i rolling dice[i]
+
+    dice has shape (len(batch), max_turns, 2); pre-rolled, so results do not
+    depend on how games are spread across threads. num_threads caps the
+    kernel's threads (every core if None), e.g. when the caller already runs
+    several processes.
+    """
+    with _thread_limit(num_threads), parallel_chunksize(PRANGE_CHUNKSIZE):
+        run_sims(dice, target_player_idx,
+                 target_property_position, enable_house_building,
+                 *pack_board(board), *pack_players(player_configs),
+                 batch.turns_played, batch.property_purchased, batch.purchase_turn,
+                 batch.purchase_price, batch.total_rent_collected, batch.total_rent_paid,
+                 batch.rent_by_turn, batch.break_even_turn, batch.final_player_cash,
+                 batch.player_won, batch.player_bankrupt)
+
+
+def precompile(board: MonopolyBoard):
+    """
+    Compile the kernel into numba's on-disk cache ahead of the first analysis
+
+    Every batch shares one signature (the array dtypes are fixed, whatever the
+    player count or max_turns), so a single tiny batch compiles it. Later
+    processes load the cached machine code instead of spending seconds in
+    the JIT. Returns False if numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    from simulator import SimulationBatch, roll_dice_batch  # Deferred, as simulator defers this module
+    player_configs = [{'cash': 1500, 'position': 0, 'owned_properties': []}]
+    dice = roll_dice_batch(np.random.default_rng(0), 1, 1)
+    play_batch(SimulationBatch.allocate(1, 1), board, dice, 0, 1, player_configs, True)
+    return True
@@ -1,9 +1,40 @@
 """
 Property data structures for Monopoly board
 """
+import functools
+import math
+import os
+import pickle
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Iterable, List, Tuple
+
+# Columns of MonopolyBoard.rent_table
+RENT_BASE = 0
+RENT_COLOR_SET = 1
+RENT_HOUSES = 1  # Column for h houses is RENT_HOUSES + h (hotel = 5 houses)
+RENT_TABLE_COLUMNS = 7
+
+# Railroad rent by number owned (1-4)
+RAILROAD_RENTS = (25, 50, 100, 200)
+
+# Utility rent by number owned (1-2): an average roll of 7 times 4 or 10
+UTILITY_RENTS = (7 * 4, 7 * 10)
+
+# Suffix of the parsed-board pickle written beside the workbook
+BOARD_PICKLE_SUFFIX = '.pkl'
+
+
+def _optional_float(value) -> Optional[float]:
+    """Spreadsheet number, or None for an empty (NaN) cell"""
+    return None if math.isnan(value) else float(value)
+
+
+def _optional_str(value) -> Optional[str]:
+    """Spreadsheet text, or None for an empty (NaN) cell"""
+    return str(value) if isinstance(value, str) else None
+
 
 @dataclass
 class Property:
@@ -22,30 +53,36 @@ class Property:
     rent_4_house: Optional[float]
     rent_hotel: Optional[float]
     house_cost: Optional[float]
+    # get_rent's answers, laid out like MonopolyBoard.rent_table columns
+    _rents: tuple = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the rent at each development level"""
+        if not self.is_purchasable():
+            self._rents = (0.0,) * RENT_TABLE_COLUMNS
+            return
+        base = self.base_rent or 0.0
+        self._rents = (
+            base,
+            # Color-set rent applies to streets only
+            (self.rent_with_color_set or 0.0) if self.property_type == 'Street' else base,
+            self.rent_1_house or 0.0,
+            self.rent_2_house or 0.0,
+            self.rent_3_house or 0.0,
+            self.rent_4_house or 0.0,
+            self.rent_hotel or 0.0,
+        )
     
     def is_purchasable(self) -> bool:
         """Can this property be purchased?"""
         return self.property_type in ['Street', 'Railroad', 'Utility']
     
     def get_rent(self, has_monopoly: bool = False, houses: int = 0) -> float:
-        """Calculate rent based on development"""
-        if not self.is_purchasable():
-            return 0.0
-        
+        """Calculate rent based on development: one lookup in the precomputed tiers"""
         if houses == 0:
-            if has_monopoly and self.property_type == 'Street':
-                return self.rent_with_color_set or 0.0
-            return self.base_rent or 0.0
-        elif houses == 1:
-            return self.rent_1_house or 0.0
-        elif houses == 2:
-            return self.rent_2_house or 0.0
-        elif houses == 3:
-            return self.rent_3_house or 0.0
-        elif houses == 4:
-            return self.rent_4_house or 0.0
-        elif houses == 5:  # Hotel
-            return self.rent_hotel or 0.0
+            return self._rents[RENT_COLOR_SET if has_monopoly else RENT_BASE]
+        if 1 <= houses <= 5:  # 5 = Hotel
+            return self._rents[RENT_HOUSES + houses]
         return 0.0
 
 
@@ -58,31 +95,103 @@ class MonopolyBoard:
         
         self.properties: List[Property] = []
         self.color_groups: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, Property] = {}
         
-        for _, row in df.iterrows():
+        # Whole columns as plain lists: no per-row Series boxing
+        cols = df.to_dict(orient='list')
+        
+        for i in range(len(df)):
             prop = Property(
-                position=int(row['Position']),
-                name=str(row['Property Name']),
-                property_type=str(row['Property Type']),
-                color=str(row['Color']) if pd.notna(row['Color']) else None,
-                purchase_price=float(row['Purchase Value']) if pd.notna(row['Purchase Value']) else None,
-                mortgage_value=float(row['Mortgage Value']) if pd.notna(row['Mortgage Value']) else None,
-                base_rent=float(row['Base Rent']) if pd.notna(row['Base Rent']) else None,
-                rent_with_color_set=float(row['Rent - Color Set']) if pd.notna(row['Rent - Color Set']) else None,
-                rent_1_house=float(row['Rent - 1']) if pd.notna(row['Rent - 1']) else None,
-                rent_2_house=float(row['Rent - 2']) if pd.notna(row['Rent - 2']) else None,
-                rent_3_house=float(row['Rent - 3']) if pd.notna(row['Rent - 3']) else None,
-                rent_4_house=float(row['Rent - 4']) if pd.notna(row['Rent - 4']) else None,
-                rent_hotel=float(row['Rent - Hotel']) if pd.notna(row['Rent - Hotel']) else None,
-                house_cost=float(row['House Cost']) if pd.notna(row['House Cost']) else None,
+                position=int(cols['Position'][i]),
+                name=str(cols['Property Name'][i]),
+                property_type=str(cols['Property Type'][i]),
+                color=_optional_str(cols['Color'][i]),
+                purchase_price=_optional_float(cols['Purchase Value'][i]),
+                mortgage_value=_optional_float(cols['Mortgage Value'][i]),
+                base_rent=_optional_float(cols['Base Rent'][i]),
+                rent_with_color_set=_optional_float(cols['Rent - Color Set'][i]),
+                rent_1_house=_optional_float(cols['Rent - 1'][i]),
+                rent_2_house=_optional_float(cols['Rent - 2'][i]),
+                rent_3_house=_optional_float(cols['Rent - 3'][i]),
+                rent_4_house=_optional_float(cols['Rent - 4'][i]),
+                rent_hotel=_optional_float(cols['Rent - Hotel'][i]),
+                house_cost=_optional_float(cols['House Cost'][i]),
             )
             self.properties.append(prop)
+            self._by_name.setdefault(prop.name, prop)  # First match, as the old scan returned
             
             # Build color group index
             if prop.color and prop.property_type == 'Street':
                 if prop.color not in self.color_groups:
                     self.color_groups[prop.color] = []
                 self.color_groups[prop.color].append(prop.position)
+        
+        # Bitmask of each color group's positions (bit p set for position p)
+        self.color_masks: Dict[str, int] = {
+            color: sum(1 << pos for pos in positions)
+            for color, positions in self.color_groups.items()
+        }
+        
+        self._build_lookup_tables()
+    
+    def _build_lookup_tables(self):
+        """
+        Flat per-position NumPy tables for rent and purchase lookups
+        
+        rent_table[position] holds base, color-set, 1-4 house and hotel rent
+        (0 where not applicable), so rent is one indexed load. color_idx holds
+        each street's index into colors (the color_groups order), -1 elsewhere.
+        """
+        num_positions = len(self.properties)
+        self.colors: List[str] = list(self.color_groups)
+        self.rent_table = np.zeros((num_positions, RENT_TABLE_COLUMNS))
+        self.purchase_price = np.full(num_positions, np.nan)
+        self.house_cost = np.zeros(num_positions)
+        self.color_idx = np.full(num_positions, -1, dtype=np.int8)
+        self.is_street = np.zeros(num_positions, dtype=bool)
+        self.is_railroad = np.zeros(num_positions, dtype=bool)
+        self.is_utility = np.zeros(num_positions, dtype=bool)
+        self.railroad_rent = np.array(RAILROAD_RENTS, dtype=np.float64)
+        self.utility_rent = np.array(UTILITY_RENTS, dtype=np.float64)
+        
+        for prop in self.properties:
+            pos = prop.position
+            self.rent_table[pos] = [
+                prop.base_rent or 0.0,
+                prop.rent_with_color_set or 0.0,
+                prop.rent_1_house or 0.0,
+                prop.rent_2_house or 0.0,
+                prop.rent_3_house or 0.0,
+                prop.rent_4_house or 0.0,
+                prop.rent_hotel or 0.0,
+            ]
+            if prop.purchase_price is not None:
+                self.purchase_price[pos] = prop.purchase_price
+            if prop.house_cost is not None:
+                self.house_cost[pos] = prop.house_cost
+            self.is_street[pos] = prop.property_type == 'Street'
+            self.is_railroad[pos] = prop.property_type == 'Railroad'
+            self.is_utility[pos] = prop.property_type == 'Utility'
+        
+        for idx, color in enumerate(self.colors):
+            self.color_idx[self.color_groups[color]] = idx
+        
+        # Position bitmasks (bit p for position p), matching Player.owned_mask
+        self.railroad_mask = sum(1 << int(pos) for pos in np.flatnonzero(self.is_railroad))
+        self.utility_mask = sum(1 << int(pos) for pos in np.flatnonzero(self.is_utility))
+    
+    @functools.cached_property
+    def table_lists(self) -> Tuple[list, ...]:
+        """
+        Plain-list views of the lookup tables, built once per board
+        
+        (rent_table, railroad_rent, utility_rent, is_railroad, is_utility,
+        color_idx): scalar reads return Python values. Shared by every game on
+        the board, so callers must not mutate them.
+        """
+        return (self.rent_table.tolist(), self.railroad_rent.tolist(),
+                self.utility_rent.tolist(), self.is_railroad.tolist(),
+                self.is_utility.tolist(), self.color_idx.tolist())
     
     def get_property(self, position: int) -> Property:
         """Get property at board position"""
@@ -90,18 +199,15 @@ class MonopolyBoard:
     
     def get_property_by_name(self, name: str) -> Optional[Property]:
         """Get property by name"""
-        for prop in self.properties:
-            if prop.name == name:
-                return prop
-        return None
+        return self._by_name.get(name)
     
-    def has_monopoly(self, owned_positions: List[int], color: str) -> bool:
+    def has_monopoly(self, owned_positions: Iterable[int], color: str) -> bool:
         """Check if player owns all properties of a color"""
         if color not in self.color_groups:
             return False
-        required = set(self.color_groups[color])
-        owned = set(owned_positions)
-        return required.issubset(owned)
+        if not isinstance(owned_positions, (set, frozenset)):
+            owned_positions = set(owned_positions)
+        return owned_positions.issuperset(self.color_groups[color])
     
     def get_monopoly_for_position(self, position: int) -> Optional[str]:
         """Get the color group for a property position"""
@@ -112,9 +218,12 @@ class MonopolyBoard:
 
 
 def load_board(excel_path: str = None) -> MonopolyBoard:
-    """Convenience function to load the board"""
-    import os
-
+    """
+    Convenience function to load the board
+    
+    Boards are memoized per path for the life of the process, so callers share
+    one (read-only) instance.
+    """
     if excel_path is None:
         # Try multiple locations
         possible_paths = [
@@ -136,7 +245,38 @@ def load_board(excel_path: str = None) -> MonopolyBoard:
                 "\n\nPlease ensure the Excel file is in the same directory as the simulator."
             )
 
-    return MonopolyBoard(excel_path)
+    return _load_board_cached(os.path.abspath(excel_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_board_cached(excel_path: str) -> MonopolyBoard:
+    """
+    Parse the workbook, or reuse the pickled board beside it
+    
+    The pickle (excel_path + '.pkl') is trusted only while its recorded
+    modification times of the workbook and of this module still match.
+    """
+    pickle_path = excel_path + BOARD_PICKLE_SUFFIX
+    stamp = (os.path.getmtime(excel_path), os.path.getmtime(__file__))
+    
+    try:
+        with open(pickle_path, 'rb') as f:
+            cached_stamp, board = pickle.load(f)
+        if cached_stamp == stamp:
+            return board
+    except Exception:
+        pass  # Missing, unreadable, stale or from another numpy/module layout: parse the workbook
+    
+    board = MonopolyBoard(excel_path)
+    # Write then rename so concurrent loads never read a partial file
+    tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((stamp, board), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except OSError:
+        pass  # Read-only location: just skip the sidecar
+    return board
 
 
 # Test the module
@@ -2,14 +2,26 @@
 Monte Carlo simulation engine for Monopoly
 Runs multiple game simulations and tracks property-specific outcomes
 """
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from properties import load_board
 from game_state import create_game, GameState, Player
-from mechanics import GameMechanics
+from mechanics import GameMechanics, ACTION_PAY_RENT
 from strategies import get_strategy
-import copy
+
+# Shares run_monte_carlo_parallel splits a batch into, whatever the worker count
+# (so results depend only on the seed); game lengths vary, as bankruptcies end
+# games early, and many small shares keep every worker busy until the end
+NUM_SHARES = 64
+
+# Turns _rent_by_turn_stats aggregates at a time: only a block of columns of the
+# purchased games is ever copied, whatever max_turns is
+AGGREGATE_TURN_BLOCK = 64
 
 
 @dataclass
@@ -35,13 +47,116 @@ class SimulationResult:
     purchase_price: float
     total_rent_collected: float
     total_rent_paid: float
-    rent_by_turn: Dict[int, float]  # turn -> cumulative rent
+    rent_by_turn: np.ndarray  # rent_by_turn[turn] -> cumulative rent, one entry per turn played
     break_even_turn: int  # -1 if never broke even
     final_player_cash: float
     player_won: bool
     player_bankrupt: bool
 
 
+@dataclass
+class SimulationBatch:
+    """
+    Results from a batch of simulations, one preallocated array per field
+
+    Row i holds simulation i. rent_by_turn is (simulations, max_turns + 1): the
+    cumulative rent after each turn, zero past the turns a game actually played.
+    Turn counts are int32; money stays float64, which holds whole dollars
+    exactly without ruling out fractional amounts from the board or configs.
+    """
+    turns_played: np.ndarray
+    property_purchased: np.ndarray
+    purchase_turn: np.ndarray
+    purchase_price: np.ndarray
+    total_rent_collected: np.ndarray
+    total_rent_paid: np.ndarray
+    rent_by_turn: np.ndarray
+    break_even_turn: np.ndarray
+    final_player_cash: np.ndarray
+    player_won: np.ndarray
+    player_bankrupt: np.ndarray
+
+    @classmethod
+    def allocate(cls, num_simulations: int, max_turns: int) -> 'SimulationBatch':
+        """Zeroed buffers for num_simulations games of at most max_turns turns"""
+        return cls(
+            turns_played=np.zeros(num_simulations, dtype=np.int32),
+            property_purchased=np.zeros(num_simulations, dtype=bool),
+            purchase_turn=np.full(num_simulations, -1, dtype=np.int32),
+            purchase_price=np.zeros(num_simulations),
+            total_rent_collected=np.zeros(num_simulations),
+            total_rent_paid=np.zeros(num_simulations),
+            rent_by_turn=np.zeros((num_simulations, max_turns + 1)),
+            break_even_turn=np.full(num_simulations, -1, dtype=np.int32),
+            final_player_cash=np.zeros(num_simulations),
+            player_won=np.zeros(num_simulations, dtype=bool),
+            player_bankrupt=np.zeros(num_simulations, dtype=bool),
+        )
+
+    @classmethod
+    def allocate_shared(cls, num_simulations: int,
+                        max_turns: int) -> Tuple['SimulationBatch', shared_memory.SharedMemory, List]:
+        """
+        allocate()'s buffers, laid out in one shared memory block
+
+        Returns (batch, block, layout); worker processes rebuild the same views
+        with from_buffer(block.buf, layout). The caller closes and unlinks the block.
+        """
+        template = cls.allocate(num_simulations, max_turns)
+        layout = []
+        size = 0
+        for name in cls.__dataclass_fields__:
+            array = getattr(template, name)
+            layout.append((name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // 8) * 8  # Keep every array 8-byte aligned
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        batch = cls.from_buffer(block.buf, layout)
+        for name in cls.__dataclass_fields__:
+            getattr(batch, name)[...] = getattr(template, name)
+        return batch, block, layout
+
+    @classmethod
+    def from_buffer(cls, buffer, layout: List) -> 'SimulationBatch':
+        """Batch of array views into buffer, as laid out by allocate_shared"""
+        return cls(**{name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+                      for name, dtype, shape, offset in layout})
+
+    def copy(self) -> 'SimulationBatch':
+        """Batch with its own copy of every array"""
+        return SimulationBatch(**{name: getattr(self, name).copy()
+                                  for name in self.__dataclass_fields__})
+
+    def __len__(self) -> int:
+        return len(self.turns_played)
+
+    def __getitem__(self, i: int) -> SimulationResult:
+        """Game i as a SimulationResult"""
+        return SimulationResult(
+            turns_played=int(self.turns_played[i]),
+            property_purchased=bool(self.property_purchased[i]),
+            purchase_turn=int(self.purchase_turn[i]),
+            purchase_price=float(self.purchase_price[i]),
+            total_rent_collected=float(self.total_rent_collected[i]),
+            total_rent_paid=float(self.total_rent_paid[i]),
+            rent_by_turn=self.rent_by_turn[i, :self.turns_played[i]].copy(),
+            break_even_turn=int(self.break_even_turn[i]),
+            final_player_cash=float(self.final_player_cash[i]),
+            player_won=bool(self.player_won[i]),
+            player_bankrupt=bool(self.player_bankrupt[i]),
+        )
+
+    def to_results(self) -> List[SimulationResult]:
+        """Materialize every game as a SimulationResult"""
+        return [self[i] for i in range(len(self))]
+
+    def padded_rent_by_turn(self) -> np.ndarray:
+        """rent_by_turn cut to the longest game, NaN past each game's last turn"""
+        max_turns = int(self.turns_played.max(initial=0))
+        padded = self.rent_by_turn[:, :max_turns].copy()
+        padded[np.arange(max_turns) >= self.turns_played[:, np.newaxis]] = np.nan
+        return padded
+
+
 class MonopolySimulator:
     """Run Monte Carlo simulations of Monopoly games"""
 
@@ -54,7 +169,8 @@ class MonopolySimulator:
                               player_configs: List[Dict],
                               max_turns: int = 100,
                               purchase_target: bool = True,
-                              enable_house_building: bool = False) -> SimulationResult:
+                              enable_house_building: bool = False,
+                              dice: Optional[np.ndarray] = None) -> SimulationResult:
         """
         Run a single game simulation
 
@@ -64,13 +180,36 @@ class MonopolySimulator:
             player_configs: Initial player configurations
             max_turns: Maximum turns to simulate
             purchase_target: If True, force target player to buy target property when landing
+            dice: This game's pre-rolled dice, shape (max_turns, 2); a fresh PCG64 stream if None
 
         Returns:
             SimulationResult with tracked metrics
         """
+        batch = SimulationBatch.allocate(1, max_turns)
+        self.play_into(batch, 0, target_player_idx, target_property_position, player_configs,
+                       max_turns, purchase_target, enable_house_building, dice)
+        return batch.to_results()[0]
+
+    def play_into(self,
+                  batch: SimulationBatch,
+                  row: int,
+                  target_player_idx: int,
+                  target_property_position: int,
+                  player_configs: List[Dict],
+                  max_turns: int = 100,
+                  purchase_target: bool = True,
+                  enable_house_building: bool = False,
+                  dice: Optional[np.ndarray] = None):
+        """
+        Play one game (see run_single_simulation) straight into row of batch
+
+        The Monte Carlo loops fill their preallocated batch this way, so no
+        per-game result object or rent dict is built.
+        """
         # Create game
         game = create_game(self.board, player_configs)
-        mechanics = GameMechanics(game, enable_house_building=enable_house_building)
+        mechanics = GameMechanics(game, enable_house_building=enable_house_building, dice=dice)
+        target_player = game.players[target_player_idx]
 
         # Property tracker
         tracker = PropertyTracker(
@@ -78,9 +217,20 @@ class MonopolySimulator:
             property_name=self.board.get_property(target_property_position).name
         )
 
-        # Track rent by turn
-        rent_by_turn = {}
-        cumulative_rent = 0
+        # Every player's strategy, resolved once per game (risk tolerance never
+        # changes mid-game)
+        strategies = [get_strategy(player.risk_tolerance) for player in game.players]
+
+        # Override strategy if this is target player landing on target property
+        if purchase_target:
+            target_base_strategy = strategies[target_player_idx]
+
+            def target_strategy(game, player, position):
+                if position == target_property_position:
+                    return True  # Always buy target property
+                return target_base_strategy(game, player, position)
+
+            strategies[target_player_idx] = target_strategy
 
         # Run simulation
         turn = 0
@@ -88,80 +238,64 @@ class MonopolySimulator:
             current_player = game.get_current_player()
             player_idx = game.current_player_idx
 
-            # Get strategy for this player
-            base_strategy = get_strategy(current_player.risk_tolerance)
-
-            # Override strategy if this is target player landing on target property
-            if player_idx == target_player_idx and purchase_target:
-                def target_strategy(game, player, position):
-                    if position == target_property_position:
-                        return True  # Always buy target property
-                    return base_strategy(game, player, position)
-
-                strategy_func = target_strategy
-            else:
-                strategy_func = base_strategy
-
             # Take turn
-            events = mechanics.take_turn(current_player, strategy_func)
-
-            # Track events
-            for event in events:
-                if event['event'] == 'purchase' and event.get('success'):
-                    if event['position'] == target_property_position:
-                        tracker.was_purchased = True
-                        tracker.purchase_turn = turn
-                        tracker.purchase_price = -event['amount']
-                        tracker.owner_name = current_player.name
-
-                elif event['event'] == 'landing' and event['action'] == 'pay_rent':
-                    if event['position'] == target_property_position:
-                        rent_amount = -event['amount']
-
-                        # Check who paid/received
-                        if player_idx == target_player_idx:
-                            # Target player paid rent
-                            tracker.total_rent_paid += rent_amount
-                        else:
-                            # Someone else paid rent to target property owner
-                            owner = game.get_property_owner(target_property_position)
-                            if owner and game.players.index(owner) == target_player_idx:
-                                # Target player collected rent
-                                tracker.total_rent_collected += rent_amount
-                                tracker.rent_events.append((turn, rent_amount))
-                                cumulative_rent += rent_amount
-
-            # Track cumulative rent by turn
-            rent_by_turn[turn] = cumulative_rent - tracker.purchase_price if tracker.was_purchased else 0
+            record = mechanics.play_turn(current_player, strategies[player_idx])
+
+            # Track the turn's outcome
+            if record.position == target_property_position:
+                if record.purchased:
+                    tracker.was_purchased = True
+                    tracker.purchase_turn = turn
+                    tracker.purchase_price = record.amount
+                    tracker.owner_name = current_player.name
+
+                elif record.action == ACTION_PAY_RENT:
+                    rent_amount = -record.amount
+
+                    # Check who paid/received
+                    if player_idx == target_player_idx:
+                        # Target player paid rent
+                        tracker.total_rent_paid += rent_amount
+                    else:
+                        # Someone else paid rent to target property owner (the record's recipient)
+                        if record.owner is target_player:
+                            # Target player collected rent
+                            tracker.total_rent_collected += rent_amount
+                            tracker.rent_events.append((turn, rent_amount))
 
             game.next_player()
             turn += 1
 
-        # Calculate break-even turn
+        # Cumulative rent by turn, net of the price from the purchase on (zero
+        # before): the rent events scattered into the batch row, then summed in place
+        rent_by_turn = batch.rent_by_turn[row, :turn]
+        rent_by_turn[:] = 0
         break_even_turn = -1
         if tracker.was_purchased:
-            for t, cum_rent in rent_by_turn.items():
-                if t > tracker.purchase_turn and cum_rent >= 0:
-                    break_even_turn = t
-                    break
+            owned_turns = rent_by_turn[tracker.purchase_turn:]
+            for event_turn, rent_amount in tracker.rent_events:
+                owned_turns[event_turn - tracker.purchase_turn] = rent_amount
+            np.cumsum(owned_turns, out=owned_turns)
+            owned_turns -= tracker.purchase_price
+
+            # Break-even turn: the first turn after the purchase back at or above zero
+            paid_back = owned_turns[1:] >= 0
+            if paid_back.any():
+                break_even_turn = tracker.purchase_turn + 1 + int(paid_back.argmax())
 
         # Get final state
-        target_player = game.players[target_player_idx]
         winner = game.get_winner()
 
-        return SimulationResult(
-            turns_played=turn,
-            property_purchased=tracker.was_purchased,
-            purchase_turn=tracker.purchase_turn,
-            purchase_price=tracker.purchase_price,
-            total_rent_collected=tracker.total_rent_collected,
-            total_rent_paid=tracker.total_rent_paid,
-            rent_by_turn=rent_by_turn,
-            break_even_turn=break_even_turn,
-            final_player_cash=target_player.cash,
-            player_won=(winner == target_player) if winner else False,
-            player_bankrupt=target_player.is_bankrupt
-        )
+        batch.turns_played[row] = turn
+        batch.property_purchased[row] = tracker.was_purchased
+        batch.purchase_turn[row] = tracker.purchase_turn
+        batch.purchase_price[row] = tracker.purchase_price
+        batch.total_rent_collected[row] = tracker.total_rent_collected
+        batch.total_rent_paid[row] = tracker.total_rent_paid
+        batch.break_even_turn[row] = break_even_turn
+        batch.final_player_cash[row] = target_player.cash
+        batch.player_won[row] = winner is target_player
+        batch.player_bankrupt[row] = target_player.is_bankrupt
 
     def run_monte_carlo(self,
                         target_player_idx: int,
@@ -170,16 +304,22 @@ class MonopolySimulator:
                         num_simulations: int = 1000,
                         max_turns: int = 100,
                         enable_house_building: bool = False,
-                        return_individual_results: bool = False) -> Dict:
+                        return_individual_results: bool = False,
+                        seed: Optional[int] = None) -> Dict:
         """
         Run Monte Carlo simulations
 
         Args:
-            return_individual_results: If True, includes raw simulation results for CSV export
+            return_individual_results: If True, includes the SimulationBatch of raw results
+                (as 'individual_results') for CSV export
+            seed: Seeds the batch's dice for reproducible runs (entropy if None); the
+                same seed rolls the same games as run_monte_carlo_compiled
 
         Returns aggregated statistics (and optionally individual results)
         """
-        results = []
+        batch = SimulationBatch.allocate(num_simulations, max_turns)
+        # Every game's dice in one vectorized draw (int8, two bytes per turn)
+        dice = roll_dice_batch(np.random.default_rng(seed), num_simulations, max_turns)
 
         print(f"Running {num_simulations} simulations...")
 
@@ -187,33 +327,152 @@ class MonopolySimulator:
             if (i + 1) % 100 == 0:
                 print(f"  Completed {i + 1}/{num_simulations}")
 
-            result = self.run_single_simulation(
+            self.play_into(
+                batch,
+                i,
                 target_player_idx,
                 target_property_position,
                 player_configs,
                 max_turns,
                 purchase_target=True,
-                enable_house_building=enable_house_building
+                enable_house_building=enable_house_building,
+                dice=dice[i]
             )
-            results.append(result)
 
         # Aggregate results
-        aggregated = self._aggregate_results(results, target_property_position)
+        aggregated = self._aggregate_results(batch, target_property_position)
 
         # Optionally include individual results for CSV export
         if return_individual_results:
-            aggregated['individual_results'] = results
+            aggregated['individual_results'] = batch
 
         return aggregated
 
-    def _aggregate_results(self, results: List[SimulationResult], position: int) -> Dict:
+    def run_monte_carlo_parallel(self,
+                                 target_player_idx: int,
+                                 target_property_position: int,
+                                 player_configs: List[Dict],
+                                 num_simulations: int = 1000,
+                                 max_turns: int = 100,
+                                 enable_house_building: bool = False,
+                                 return_individual_results: bool = False,
+                                 num_workers: Optional[int] = None,
+                                 seed: Optional[int] = None) -> Dict:
+        """
+        Run Monte Carlo simulations split across worker processes
+
+        Games are independent, so the batch is split into NUM_SHARES shares, each
+        played by whichever worker is free with its own dice stream, and the
+        results are aggregated exactly as in run_monte_carlo.
+
+        Args:
+            num_workers: Worker processes (defaults to the CPU count); 1 runs in-process
+            seed: Seeds every share's stream for reproducible runs (entropy if None)
+
+        Returns aggregated statistics (and optionally individual results)
+        """
+        num_shares = max(1, min(num_simulations, NUM_SHARES))
+        num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_shares))
+        share_sizes = [num_simulations // num_shares + (i < num_simulations % num_shares)
+                       for i in range(num_shares)]
+        starts = np.cumsum([0, *share_sizes]).tolist()
+        seeds = [int(child.generate_state(1)[0])
+                 for child in np.random.SeedSequence(seed).spawn(num_shares)]
+        simulation_kwargs = {
+            'target_player_idx': target_player_idx,
+            'target_property_position': target_property_position,
+            'player_configs': player_configs,
+            'max_turns': max_turns,
+            'purchase_target': True,
+            'enable_house_building': enable_house_building,
+        }
+
+        print(f"Running {num_simulations} simulations across {num_workers} worker(s)...")
+
+        if num_workers == 1:
+            batch = SimulationBatch.allocate(num_simulations, max_turns)
+            for share_seed, start, stop in zip(seeds, starts[:-1], starts[1:]):
+                _play_rows(batch, self.board, share_seed, start, stop, simulation_kwargs)
+        else:
+            # Workers write their rows straight into one shared batch, so no result
+            # arrays are pickled back; the board is sent once per worker, not per share
+            shared, block, layout = SimulationBatch.allocate_shared(num_simulations, max_turns)
+            try:
+                with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                         initargs=(self.board,)) as executor:
+                    list(executor.map(
+                        _play_shared_rows, repeat(block.name), repeat(layout),
+                        seeds, starts[:-1], starts[1:], repeat(simulation_kwargs)
+                    ))
+                batch = shared.copy()
+            finally:
+                del shared  # Release the views before closing the block
+                block.close()
+                block.unlink()
+
+        # Aggregate results
+        aggregated = self._aggregate_results(batch, target_property_position)
+
+        # Optionally include individual results for CSV export
+        if return_individual_results:
+            aggregated['individual_results'] = batch
+
+        return aggregated
+
+    def run_monte_carlo_compiled(self,
+                                 target_player_idx: int,
+                                 target_property_position: int,
+                                 player_configs: List[Dict],
+                                 num_simulations: int = 1000,
+                                 max_turns: int = 100,
+                                 enable_house_building: bool = False,
+                                 return_individual_results: bool = False,
+                                 seed: Optional[int] = None,
+                                 num_threads: Optional[int] = None) -> Dict:
+        """
+        Run Monte Carlo simulations in the compiled kernel (mechanics_numba)
+
+        Same rules and statistics as run_monte_carlo, with every game played in
+        numba-compiled code across all cores. Requires numba (see
+        mechanics_numba.NUMBA_AVAILABLE).
+
+        Args:
+            seed: Seeds every game's dice for reproducible runs (entropy if None)
+            num_threads: Kernel threads to use (every core if None); results do
+                not depend on it
+
+        Returns aggregated statistics (and optionally individual results)
+        """
+        import mechanics_numba
+
+        batch = SimulationBatch.allocate(num_simulations, max_turns)
+        # Every die of the batch in one draw
+        dice = roll_dice_batch(np.random.default_rng(seed), num_simulations, max_turns)
+
+        print(f"Running {num_simulations} compiled simulations...")
+
+        mechanics_numba.play_batch(batch, self.board, dice, target_player_idx,
+                                   target_property_position, player_configs,
+                                   enable_house_building, num_threads)
+
+        # Aggregate results
+        aggregated = self._aggregate_results(batch, target_property_position)
+
+        # Optionally include individual results for CSV export
+        if return_individual_results:
+            aggregated['individual_results'] = batch
+
+        return aggregated
+
+    def _aggregate_results(self, batch: SimulationBatch, position: int) -> Dict:
         """Aggregate simulation results into statistics"""
         prop = self.board.get_property(position)
 
         # Filter to games where property was purchased
-        purchased_results = [r for r in results if r.property_purchased]
+        purchased = batch.property_purchased
+        num_purchased = int(purchased.sum())
 
-        if not purchased_results:
+        if not num_purchased:
             return {
                 'property_name': prop.name,
                 'property_price': prop.purchase_price,
@@ -222,58 +481,121 @@ class MonopolySimulator:
             }
 
         # Break-even analysis
-        break_even_turns = [r.break_even_turn for r in purchased_results
-                            if r.break_even_turn > 0]
+        break_even_turns = batch.break_even_turn[purchased].astype(np.float64)
+        break_even_turns = break_even_turns[break_even_turns > 0]
 
-        # Rent collection by turn
-        max_turn = max(r.turns_played for r in purchased_results)
-        rent_by_turn_matrix = []
-
-        for r in purchased_results:
-            turn_rents = []
-            for t in range(max_turn + 1):
-                turn_rents.append(r.rent_by_turn.get(t, 0))
-            rent_by_turn_matrix.append(turn_rents)
-
-        rent_by_turn_array = np.array(rent_by_turn_matrix)
+        # Rent collection by turn: the preallocated rows, cut to the longest purchased game
+        max_turn = int(batch.turns_played[purchased].max())
+        rent_mean, rent_std, rent_p25, rent_p75 = _rent_by_turn_stats(
+            batch.rent_by_turn, purchased, max_turn + 1)
+        total_rent = batch.total_rent_collected[purchased]
 
         # Calculate statistics
         stats = {
             'property_name': prop.name,
             'property_position': position,
             'property_price': prop.purchase_price,
-            'num_simulations': len(results),
-            'purchase_rate': len(purchased_results) / len(results),
+            'num_simulations': len(batch),
+            'purchase_rate': num_purchased / len(batch),
 
             # Break-even statistics
-            'break_even_mean': np.mean(break_even_turns) if break_even_turns else -1,
-            'break_even_median': np.median(break_even_turns) if break_even_turns else -1,
-            'break_even_std': np.std(break_even_turns) if break_even_turns else 0,
+            'break_even_mean': np.mean(break_even_turns) if break_even_turns.size else -1,
+            'break_even_median': np.median(break_even_turns) if break_even_turns.size else -1,
+            'break_even_std': np.std(break_even_turns) if break_even_turns.size else 0,
             'break_even_distribution': break_even_turns,
-            'break_even_rate': len(break_even_turns) / len(purchased_results),
+            'break_even_rate': break_even_turns.size / num_purchased,
 
             # Rent statistics
-            'total_rent_mean': np.mean([r.total_rent_collected for r in purchased_results]),
-            'total_rent_median': np.median([r.total_rent_collected for r in purchased_results]),
-            'total_rent_std': np.std([r.total_rent_collected for r in purchased_results]),
+            'total_rent_mean': np.mean(total_rent),
+            'total_rent_median': np.median(total_rent),
+            'total_rent_std': np.std(total_rent),
 
             # Cash flow by turn (mean and confidence intervals)
-            'rent_by_turn_mean': np.mean(rent_by_turn_array, axis=0),
-            'rent_by_turn_std': np.std(rent_by_turn_array, axis=0),
-            'rent_by_turn_p25': np.percentile(rent_by_turn_array, 25, axis=0),
-            'rent_by_turn_p75': np.percentile(rent_by_turn_array, 75, axis=0),
+            'rent_by_turn_mean': rent_mean,
+            'rent_by_turn_std': rent_std,
+            'rent_by_turn_p25': rent_p25,
+            'rent_by_turn_p75': rent_p75,
 
             # Win rate
-            'win_rate': np.mean([r.player_won for r in purchased_results]),
-            'bankruptcy_rate': np.mean([r.player_bankrupt for r in purchased_results]),
+            'win_rate': np.mean(batch.player_won[purchased]),
+            'bankruptcy_rate': np.mean(batch.player_bankrupt[purchased]),
 
             # Final cash
-            'final_cash_mean': np.mean([r.final_player_cash for r in purchased_results]),
+            'final_cash_mean': np.mean(batch.final_player_cash[purchased]),
         }
 
         return stats
 
 
+def _rent_by_turn_stats(rent_by_turn: np.ndarray, rows: np.ndarray,
+                        num_turns: int) -> Tuple[np.ndarray, ...]:
+    """
+    Mean, std, 25th and 75th percentile of each of the first num_turns columns
+    of rent_by_turn over the selected rows
+
+    Streams AGGREGATE_TURN_BLOCK columns at a time, so the copy of the selected
+    rows (and np.std's temporaries) is one block wide rather than the whole
+    matrix. Each column is reduced on its own, so the values are the same as
+    over the full slice.
+    """
+    stats = np.empty((4, num_turns))
+    for start in range(0, num_turns, AGGREGATE_TURN_BLOCK):
+        stop = min(start + AGGREGATE_TURN_BLOCK, num_turns)
+        block = rent_by_turn[rows, start:stop]  # Fresh copy, owned here
+        mean = np.mean(block, axis=0, keepdims=True)
+        stats[0, start:stop] = mean[0]
+        # np.std reuses the mean rather than summing the block again
+        stats[1, start:stop] = np.std(block, axis=0, mean=mean)
+        # Both quartiles from one partition of each column, sorted in place (last use)
+        stats[2:, start:stop] = np.percentile(block, [25, 75], axis=0, overwrite_input=True)
+    return tuple(stats)
+
+
+def _play_rows(batch: SimulationBatch, board, seed: int, start: int, stop: int,
+               simulation_kwargs: Dict):
+    """
+    Play one share of run_monte_carlo_parallel into rows start:stop
+
+    Rolls the whole share's dice from seed up front.
+    """
+    dice = roll_dice_batch(np.random.default_rng(seed), stop - start,
+                           simulation_kwargs['max_turns'])
+    simulator = MonopolySimulator(board)
+    for i in range(start, stop):
+        simulator.play_into(batch, i, **simulation_kwargs, dice=dice[i - start])
+
+
+# The board of a run_monte_carlo_parallel worker process, set by _init_worker
+_worker_board = None
+
+
+def _init_worker(board):
+    """Keep the board in a worker process for all the shares it plays"""
+    global _worker_board
+    _worker_board = board
+
+
+def _play_shared_rows(block_name: str, layout: List, seed: int, start: int, stop: int,
+                      simulation_kwargs: Dict):
+    """
+    _play_rows into the shared batch of run_monte_carlo_parallel
+
+    Module-level so worker processes can unpickle it.
+    """
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        batch = SimulationBatch.from_buffer(block.buf, layout)
+        _play_rows(batch, _worker_board, seed, start, stop, simulation_kwargs)
+        del batch  # Release the views before closing the block
+    finally:
+        block.close()
+
+
+def roll_dice_batch(rng: np.random.Generator, num_simulations: int, max_turns: int) -> np.ndarray:
+    """Dice for a batch of games in one draw: dice[game, turn] = (die1, die2)"""
+    return rng.integers(1, 7, size=(num_simulations, max_turns, 2), dtype=np.int8)
+
+
 # Test the simulator
 if __name__ == '__main__':
     print("Testing Monopoly Simulator\n")
@@ -23,10 +23,9 @@ def conservative_strategy(game: GameState, player: Player, position: int) -> boo
     # Always buy if it completes a monopoly
     if prop.color and prop.property_type == 'Street':
         # Check if we own other properties in this color group
-        color_group_positions = game.board.color_groups.get(prop.color, [])
-        owned_in_group = sum(1 for pos in color_group_positions 
-                            if player.owns_property(pos))
-        total_in_group = len(color_group_positions)
+        group_mask = game.board.color_masks.get(prop.color, 0)
+        owned_in_group = player.count_owned(group_mask)
+        total_in_group = group_mask.bit_count()
         
         # If this would complete monopoly, buy it
         if owned_in_group == total_in_group - 1:
@@ -83,10 +82,9 @@ def balanced_strategy(game: GameState, player: Player, position: int) -> bool:
     
     # High priority: Completes monopoly
     if prop.color and prop.property_type == 'Street':
-        color_group_positions = game.board.color_groups.get(prop.color, [])
-        owned_in_group = sum(1 for pos in color_group_positions 
-                            if player.owns_property(pos))
-        total_in_group = len(color_group_positions)
+        group_mask = game.board.color_masks.get(prop.color, 0)
+        owned_in_group = player.count_owned(group_mask)
+        total_in_group = group_mask.bit_count()
         
         # Would complete monopoly - high priority
         if owned_in_group == total_in_group - 1:
@@ -104,9 +102,7 @@ def balanced_strategy(game: GameState, player: Player, position: int) -> bool:
     
     # Lower priority: Utilities
     if prop.property_type == 'Utility':
-        utility_positions = [12, 28]
-        owned_utilities = sum(1 for pos in utility_positions 
-                             if player.owns_property(pos))
+        owned_utilities = player.count_owned(game.board.utility_mask)
         # Buy second utility to complete the pair
         return owned_utilities == 1
     
@@ -159,10 +155,9 @@ def analyze_purchase_value(game: GameState, player: Player, position: int) -> di
     
     # Check monopoly status
     if prop.color and prop.property_type == 'Street':
-        color_group_positions = game.board.color_groups.get(prop.color, [])
-        owned_in_group = sum(1 for pos in color_group_positions 
-                            if player.owns_property(pos))
-        total_in_group = len(color_group_positions)
+        group_mask = game.board.color_masks.get(prop.color, 0)
+        owned_in_group = player.count_owned(group_mask)
+        total_in_group = group_mask.bit_count()
         
         if owned_in_group == total_in_group - 1:
             analysis['completes_monopoly'] = True
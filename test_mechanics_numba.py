@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Parity test: compiled kernel (mechanics_numba) vs the Python engine
+
+Plays the same seeded games through run_monte_carlo_compiled and
+run_monte_carlo and checks every SimulationBatch array is identical, so a rule
+change in mechanics.py, strategies.py or house_building.py that the kernel
+doesn't follow shows up here.
+"""
+
+import numpy as np
+
+from mechanics_numba import NUMBA_AVAILABLE
+from properties import load_board
+from simulator import MonopolySimulator, SimulationBatch
+
+print("="*70)
+print("TESTING COMPILED KERNEL PARITY WITH THE PYTHON ENGINE")
+print("="*70)
+
+if not NUMBA_AVAILABLE:
+    print("\nnumba not installed: checking the kernel's rules run as plain Python")
+
+board = load_board()
+simulator = MonopolySimulator(board)
+
+# (description, target position, player configs)
+scenarios = [
+    (
+        "Buying North Carolina completes Green",
+        32,
+        [
+            {'name': 'You', 'cash': 3500, 'position': 20, 'owned_properties': [31], 'risk_tolerance': 0.6},
+            {'name': 'Opponent', 'cash': 1500, 'position': 5, 'owned_properties': [1, 3], 'risk_tolerance': 0.5},
+        ]
+    ),
+    (
+        "Railroad, conservative buyer, four players",
+        5,
+        [
+            {'name': 'You', 'cash': 800, 'position': 12, 'owned_properties': [21, 23, 15], 'risk_tolerance': 0.3},
+            {'name': 'Opponent 1', 'cash': 2500, 'position': 0, 'owned_properties': [39, 6, 8, 9],
+             'risk_tolerance': 0.2, 'min_cash_reserve': 100},
+            {'name': 'Opponent 2', 'cash': 1000, 'position': 30, 'owned_properties': [31, 32, 12], 'risk_tolerance': 0.5},
+            {'name': 'Opponent 3', 'cash': 3000, 'position': 2, 'owned_properties': [], 'risk_tolerance': 0.45},
+        ]
+    ),
+    (
+        "Utility, create_game defaults only",
+        28,
+        [
+            {'name': 'You', 'risk_tolerance': 0.8},
+            {'name': 'Opponent', 'owned_properties': [12]},
+        ]
+    ),
+]
+
+failures = 0
+for description, target, player_configs in scenarios:
+    for enable_house_building in (False, True):
+        label = f"{description} ({'with' if enable_house_building else 'without'} house building)"
+        print("\n" + "-" * 70)
+        print(label)
+        print("-" * 70)
+
+        results = []
+        for run in (simulator.run_monte_carlo_compiled, simulator.run_monte_carlo):
+            results.append(run(
+                target_player_idx=0,
+                target_property_position=target,
+                player_configs=player_configs,
+                num_simulations=300,
+                max_turns=150,
+                enable_house_building=enable_house_building,
+                return_individual_results=True,
+                seed=7
+            )['individual_results'])
+
+        compiled, reference = results
+        mismatched = [name for name in SimulationBatch.__dataclass_fields__
+                      if not np.array_equal(getattr(compiled, name), getattr(reference, name))]
+        if mismatched:
+            failures += 1
+            print(f"❌ Arrays differ: {', '.join(mismatched)}")
+        else:
+            print("✅ Every SimulationBatch array matches")
+
+print("\n" + "="*70)
+assert not failures, f"{failures} scenario(s) differ between the kernel and the Python engine"
+print("✅ COMPILED KERNEL MATCHES THE PYTHON ENGINE")
+print("="*70)
@@ -69,6 +69,18 @@ except Exception as e:
     print(f"   ✗ Error in analytics: {e}")
     exit(1)
 
+# Test 5: Compiled kernel (optional)
+print("\n5. Compiling simulation kernel...")
+try:
+    from mechanics_numba import precompile
+    if precompile(board):
+        print(f"   ✓ Kernel compiled and cached for later runs")
+    else:
+        print(f"   - numba not installed, using the pure Python engine")
+except Exception as e:
+    print(f"   ✗ Error compiling kernel: {e}")
+    exit(1)
+
 print("\n" + "="*60)
 print("✅ ALL TESTS PASSED!")
 print("="*60)